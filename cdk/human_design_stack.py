@@ -1,9 +1,14 @@
 """CDK stack for Human Design web application infrastructure."""
 
+import os
+
 from aws_cdk import (
+    BundlingOptions,
     Stack,
     Duration,
     RemovalPolicy,
+    aws_ecr as ecr,
+    aws_ecr_assets as ecr_assets,
     aws_s3 as s3,
     aws_secretsmanager as secretsmanager,
     aws_lambda as lambda_,
@@ -14,6 +19,11 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+# The FastAPI Lambda only needs the package sources and the handler; limiting
+# the asset to them keeps its hash stable across unrelated repo changes, so
+# synth reuses the already-built asset instead of re-bundling.
+_FASTAPI_ASSET_EXCLUDE = ["*", "!pyproject.toml", "!src", "!src/**", "!lambda", "!lambda/**"]
+
 
 class HumanDesignStack(Stack):
     """AWS infrastructure for Human Design web application"""
@@ -48,31 +58,99 @@ class HumanDesignStack(Stack):
             ],
         )
 
-        # 3. Lambda function for FastAPI (container image)
-        fastapi_lambda = lambda_.DockerImageFunction(
-            self,
-            "FastAPILambda",
-            code=lambda_.DockerImageCode.from_image_asset(
-                "../",
-                file="Dockerfile",
-                target="runtime",
-            ),
-            memory_size=512,
-            timeout=Duration.seconds(30),
-            environment={
-                "SECRET_NAME": self.secrets.secret_name,
-                "WEBAPP_PASSWORD_SECRET": self.webapp_password_secret.secret_name,
-                "SESSION_SECRET_KEY": "human-design-session-secret",
-                "DATA_BUCKET": data_bucket.bucket_name,
-            },
-        )
+        # 3. Lambda function for FastAPI (Graviton; images and bundles are
+        # built for linux/arm64)
+        # `cdk deploy -c lambda_packaging=zip` ships a zip asset instead of the
+        # container image; for a dependency set this small it skips the image
+        # pull on cold start.
+        use_zip = self.node.try_get_context("lambda_packaging") == "zip"
+        lambda_environment = {
+            "SECRET_NAME": self.secrets.secret_name,
+            "WEBAPP_PASSWORD_SECRET": self.webapp_password_secret.secret_name,
+            "SESSION_SECRET_KEY": "human-design-session-secret",
+            "DATA_BUCKET": data_bucket.bucket_name,
+        }
+
+        if use_zip:
+            fastapi_lambda = lambda_.Function(
+                self,
+                "FastAPILambda",
+                runtime=lambda_.Runtime.PYTHON_3_12,
+                handler="handler.handler",
+                code=lambda_.Code.from_asset(
+                    "../",
+                    exclude=_FASTAPI_ASSET_EXCLUDE,
+                    bundling=BundlingOptions(
+                        image=lambda_.Runtime.PYTHON_3_12.bundling_image,
+                        platform="linux/arm64",
+                        command=[
+                            "bash",
+                            "-c",
+                            "pip install --no-cache-dir . mangum -t /asset-output"
+                            " && cp lambda/handler.py /asset-output/",
+                        ],
+                    ),
+                ),
+                architecture=lambda_.Architecture.ARM_64,
+                memory_size=1024,
+                timeout=Duration.seconds(30),
+                environment=lambda_environment,
+            )
+        else:
+            if os.environ.get("CDK_SKIP_BUILD"):
+                # `CDK_SKIP_BUILD=1 cdk ls` / `cdk synth` point at an image that
+                # is already pushed instead of running docker build on synth.
+                image_tag = os.environ.get("FASTAPI_IMAGE_TAG")
+                if not image_tag:
+                    raise ValueError(
+                        "CDK_SKIP_BUILD is set, so FASTAPI_IMAGE_TAG must name the "
+                        "already-pushed FastAPI image tag or digest to deploy"
+                    )
+                image_repo = ecr.Repository.from_repository_name(
+                    self,
+                    "FastAPIImageRepo",
+                    os.environ.get(
+                        "FASTAPI_IMAGE_REPO",
+                        f"cdk-hnb659fds-container-assets-{self.account}-{self.region}",
+                    ),
+                )
+                image_code = lambda_.DockerImageCode.from_ecr(
+                    image_repo,
+                    tag_or_digest=image_tag,
+                )
+            else:
+                image_code = lambda_.DockerImageCode.from_image_asset(
+                    "../",
+                    file="Dockerfile",
+                    target="runtime",
+                    platform=ecr_assets.Platform.LINUX_ARM64,
+                    exclude=[*_FASTAPI_ASSET_EXCLUDE, "!Dockerfile"],
+                )
+
+            fastapi_lambda = lambda_.DockerImageFunction(
+                self,
+                "FastAPILambda",
+                code=image_code,
+                architecture=lambda_.Architecture.ARM_64,
+                memory_size=1024,
+                timeout=Duration.seconds(30),
+                environment=lambda_environment,
+            )
 
         # Grant Lambda access to secrets and S3
         self.secrets.grant_read(fastapi_lambda)
         self.webapp_password_secret.grant_read(fastapi_lambda)
         data_bucket.grant_read_write(fastapi_lambda)
 
-        # 4. API Gateway HTTP API
+        # 4. Lambda Function URL - direct HTTPS endpoint without the API Gateway
+        # hop. BUFFERED because Mangum returns whole responses; the HTTP API
+        # below stays for clients that already use its URL.
+        function_url = fastapi_lambda.add_function_url(
+            auth_type=lambda_.FunctionUrlAuthType.NONE,
+            invoke_mode=lambda_.InvokeMode.BUFFERED,
+        )
+
+        # 5. API Gateway HTTP API
         api = apigw.HttpApi(
             self,
             "HDAPI",
@@ -95,13 +173,19 @@ class HumanDesignStack(Stack):
             value=api.url or "",
             description="FastAPI base URL"
         )
+        CfnOutput(
+            self,
+            "FunctionUrlOutput",
+            value=function_url.url,
+            description="FastAPI Lambda Function URL (no API Gateway hop)"
+        )
         CfnOutput(
             self,
             "DataBucketOutput",
             value=data_bucket.bucket_name
         )
 
-        # 5. GitHub Actions OIDC federation for CI/CD deployments
+        # 6. GitHub Actions OIDC federation for CI/CD deployments
         gh_oidc_provider = iam.OpenIdConnectProvider(
             self,
             "GitHubOIDCProvider",
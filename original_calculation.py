@@ -4,6 +4,7 @@ Compute Human Design-style planetary activations (Gate.Line) from birth datetime
 
 Dependencies:
   pip install pyswisseph geopy timezonefinder
+  pip install orjson  # optional, faster JSON output
 
 Usage:
   python hd_bodygraph.py \
@@ -13,7 +14,8 @@ Usage:
     --out bodygraph.json
 
 Notes:
-- Geocoding uses Nominatim (OpenStreetMap) via geopy: free, rate-limited. Consider caching.
+- Geocoding uses ArcGIS via geopy: free, rate-limited. Results are cached in a
+  local sqlite file (.geocode_cache.sqlite3).
 - Timezone is resolved offline from coordinates via timezonefinder.
 - Planetary longitudes computed via Swiss Ephemeris (pyswisseph).
 - Gate mapping uses a gate-by-degree table (tropical zodiac degrees).
@@ -22,170 +24,51 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import math
 import os
+import sqlite3
 import time
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, NamedTuple
 from zoneinfo import ZoneInfo
 
 import swisseph as swe  # pyswisseph
-from geopy.geocoders import Nominatim
-from timezonefinder import TimezoneFinder
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from original_calculation_tables import (
+    BUCKET_FIRST_SEGMENT,
+    GATE_RANGES,  # noqa: F401  (re-exported)
+    SEGMENT_STARTS,
+    SEGMENTS,
+)
 
 # -------------------------
 # Gate-by-degree mapping
 # -------------------------
-# Source table format:
-# Each entry is (gate, start_deg, end_deg) on the tropical zodiac circle,
-# where degrees are absolute [0, 360) with 0 = 0° Aries.
-#
-# The Barney+flow "gates by degrees" page provides these ranges by sign
-# in degrees+minutes+seconds. We encode them here in decimal degrees.
-#
-# IMPORTANT: This list must cover the full 360° without gaps/overlaps.
-#            If you want, you can regenerate this list programmatically
-#            from a scraped/structured source, but this keeps it simple
-#            and offline once installed.
-#
-# Ranges are [start, end) going forward; wrap-around handled separately.
-#
-# Aries starts at 0°, Taurus 30°, Gemini 60°, ... Pisces 330°.
-#
-# NOTE: The Barney+flow page uses ranges like "28°15' Pisces – 03°52'30\" Aries".
-#       That implies wrap-around across 360°. We encode those as two segments
-#       (e.g., Pisces 28.25°..30°, Aries 0°..3.875°).
+# Each GATE_RANGES entry is (gate, start_deg, end_deg) on the tropical zodiac
+# circle, absolute [0, 360) with 0 = 0° Aries, taken from the Barney+flow
+# "gates by degrees" page. The table and its lookup index are generated as
+# literals into original_calculation_tables.py (see
+# scripts/generate_gate_tables.py, which also documents the source table), so
+# import does no arithmetic.
 #
-# For brevity, we include the full 64-gate coverage.
+# Gate boundaries are *nearly* every 5°37'30", but a few published boundaries
+# (the 22°27'30" ones) break that spacing, so a uniform 64-bucket table would
+# disagree with the table. Instead we cut the circle into 1° buckets: every
+# segment is wider than 1°, so a bucket overlaps at most two segments and a
+# lookup is one index plus at most one comparison.
 #
-# If you spot a mismatch with your favorite calculator, the usual culprits are:
-# - sidereal vs tropical (Human Design uses tropical)
-# - different ephemeris settings / node type
-# - rounding at exact boundaries
-GATE_RANGES: list[tuple[int, float, float]] = []
-
-
-def _d(sign_base: float, deg: int, minutes: int = 0, seconds: int = 0) -> float:
-    return sign_base + deg + minutes / 60.0 + seconds / 3600.0
-
-
-def _add(gate: int, start: float, end: float) -> None:
-    GATE_RANGES.append((gate, start, end))
-
-
-def _build_gate_ranges() -> None:
-    # Sign bases:
-    AR, TA, GE, CA, LE, VI, LI, SC, SG, CP, AQ, PI = (
-        0.0,
-        30.0,
-        60.0,
-        90.0,
-        120.0,
-        150.0,
-        180.0,
-        210.0,
-        240.0,
-        270.0,
-        300.0,
-        330.0,
-    )
-
-    # --- ARIES (0..30) ---
-    # Gate 25: 28°15' Pisces -> 3°52'30 Aries (wrap)
-    _add(25, _d(PI, 28, 15, 0), 360.0)
-    _add(25, 0.0, _d(AR, 3, 52, 30))
-    _add(17, _d(AR, 3, 52, 30), _d(AR, 9, 30, 0))
-    _add(21, _d(AR, 9, 30, 0), _d(AR, 15, 7, 30))
-    _add(51, _d(AR, 15, 7, 30), _d(AR, 20, 45, 0))
-    _add(42, _d(AR, 20, 45, 0), _d(AR, 26, 22, 30))
-    _add(3, _d(AR, 26, 22, 30), _d(TA, 2, 0, 0))  # extends into Taurus
-
-    # --- TAURUS (30..60) ---
-    _add(27, _d(TA, 2, 0, 0), _d(TA, 7, 37, 30))
-    _add(24, _d(TA, 7, 37, 30), _d(TA, 13, 15, 0))
-    _add(2, _d(TA, 13, 15, 0), _d(TA, 18, 52, 30))
-    _add(23, _d(TA, 18, 52, 30), _d(TA, 24, 30, 0))
-    _add(8, _d(TA, 24, 30, 0), _d(GE, 0, 7, 30))  # into Gemini
-
-    # --- GEMINI (60..90) ---
-    _add(20, _d(GE, 0, 7, 30), _d(GE, 5, 45, 0))
-    _add(16, _d(GE, 5, 45, 0), _d(GE, 11, 22, 30))
-    _add(35, _d(GE, 11, 22, 30), _d(GE, 17, 0, 0))
-    _add(45, _d(GE, 17, 0, 0), _d(GE, 22, 27, 30))
-    _add(12, _d(GE, 22, 27, 30), _d(GE, 28, 15, 0))
-    _add(15, _d(GE, 28, 15, 0), _d(CA, 3, 52, 30))  # into Cancer
-
-    # --- CANCER (90..120) ---
-    _add(52, _d(CA, 3, 52, 30), _d(CA, 9, 30, 0))
-    _add(39, _d(CA, 9, 30, 0), _d(CA, 15, 7, 30))
-    _add(53, _d(CA, 15, 7, 30), _d(CA, 20, 45, 0))
-    _add(62, _d(CA, 20, 45, 0), _d(CA, 26, 22, 30))
-    _add(56, _d(CA, 26, 22, 30), _d(LE, 2, 0, 0))  # into Leo
-
-    # --- LEO (120..150) ---
-    _add(31, _d(LE, 2, 0, 0), _d(LE, 7, 37, 30))
-    _add(33, _d(LE, 7, 37, 30), _d(LE, 13, 15, 0))
-    _add(7, _d(LE, 13, 15, 0), _d(LE, 18, 52, 30))
-    _add(4, _d(LE, 18, 52, 30), _d(LE, 24, 30, 0))
-    _add(29, _d(LE, 24, 30, 0), _d(VI, 0, 7, 30))  # into Virgo
-
-    # --- VIRGO (150..180) ---
-    _add(59, _d(VI, 0, 7, 30), _d(VI, 5, 45, 0))
-    _add(40, _d(VI, 5, 45, 0), _d(VI, 11, 22, 30))
-    _add(64, _d(VI, 11, 22, 30), _d(VI, 17, 0, 0))
-    _add(47, _d(VI, 17, 0, 0), _d(VI, 22, 27, 30))
-    _add(6, _d(VI, 22, 27, 30), _d(VI, 28, 15, 0))
-    _add(46, _d(VI, 28, 15, 0), _d(LI, 3, 52, 30))  # into Libra
-
-    # --- LIBRA (180..210) ---
-    _add(18, _d(LI, 3, 52, 30), _d(LI, 9, 30, 0))
-    _add(48, _d(LI, 9, 30, 0), _d(LI, 15, 7, 30))
-    _add(57, _d(LI, 15, 7, 30), _d(LI, 20, 45, 0))
-    _add(32, _d(LI, 20, 45, 0), _d(LI, 26, 22, 30))
-    _add(50, _d(LI, 26, 22, 30), _d(SC, 2, 0, 0))  # into Scorpio
-
-    # --- SCORPIO (210..240) ---
-    _add(28, _d(SC, 2, 0, 0), _d(SC, 7, 37, 30))
-    _add(44, _d(SC, 7, 37, 30), _d(SC, 13, 15, 0))
-    _add(1, _d(SC, 13, 15, 0), _d(SC, 18, 52, 30))
-    _add(43, _d(SC, 18, 52, 30), _d(SC, 24, 30, 0))
-    _add(14, _d(SC, 24, 30, 0), _d(SG, 0, 7, 30))  # into Sagittarius
-
-    # --- SAGITTARIUS (240..270) ---
-    _add(34, _d(SG, 0, 7, 30), _d(SG, 5, 45, 0))
-    _add(9, _d(SG, 5, 45, 0), _d(SG, 11, 22, 30))
-    _add(5, _d(SG, 11, 22, 30), _d(SG, 17, 0, 0))
-    _add(26, _d(SG, 17, 0, 0), _d(SG, 22, 27, 30))
-    _add(11, _d(SG, 22, 27, 30), _d(SG, 28, 15, 0))
-    _add(10, _d(SG, 28, 15, 0), _d(CP, 3, 52, 30))  # into Capricorn
-
-    # --- CAPRICORN (270..300) ---
-    _add(58, _d(CP, 3, 52, 30), _d(CP, 9, 30, 0))
-    _add(38, _d(CP, 9, 30, 0), _d(CP, 15, 7, 30))
-    _add(54, _d(CP, 15, 7, 30), _d(CP, 20, 45, 0))
-    _add(61, _d(CP, 20, 45, 0), _d(CP, 26, 22, 30))
-    _add(60, _d(CP, 26, 22, 30), _d(AQ, 2, 0, 0))  # into Aquarius
-
-    # --- AQUARIUS (300..330) ---
-    _add(41, _d(AQ, 2, 0, 0), _d(AQ, 7, 37, 30))
-    _add(19, _d(AQ, 7, 37, 30), _d(AQ, 13, 15, 0))
-    _add(13, _d(AQ, 13, 15, 0), _d(AQ, 18, 52, 30))
-    _add(49, _d(AQ, 18, 52, 30), _d(AQ, 24, 30, 0))
-    _add(30, _d(AQ, 24, 30, 0), _d(PI, 0, 7, 30))  # into Pisces
-
-    # --- PISCES (330..360) ---
-    _add(55, _d(PI, 0, 7, 30), _d(PI, 5, 45, 0))
-    _add(37, _d(PI, 5, 45, 0), _d(PI, 11, 22, 30))
-    _add(63, _d(PI, 11, 22, 30), _d(PI, 17, 0, 0))
-    _add(22, _d(PI, 17, 0, 0), _d(PI, 22, 27, 30))
-    _add(36, _d(PI, 22, 27, 30), _d(PI, 28, 15, 0))
-    # Remaining Pisces tail (28°15'..30°) is Gate 25 already added above.
-
-
-_build_gate_ranges()
-
+# Segments are [start, end) with start <= end (the Gate 25 wrap is split in two).
 
 # -------------------------
 # Core utilities
@@ -198,8 +81,7 @@ class Location:
     timezone: str
 
 
-@dataclass(frozen=True)
-class Activation:
+class Activation(NamedTuple):
     planet: str
     longitude: float  # degrees [0, 360)
     gate: int
@@ -216,36 +98,55 @@ def _angdiff_signed(a: float, b: float) -> float:
     return d
 
 
-def geocode_place(place: str, cache_path: str = ".geocode_cache.json") -> tuple[float, float]:
-    """Geocode a human-readable place string to (lat, lon). Uses a simple JSON cache."""
+def _geocode_db(cache_path: str) -> sqlite3.Connection:
+    """Open (creating if needed) the sqlite geocode cache at cache_path."""
+    conn = sqlite3.connect(cache_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS geo (place TEXT PRIMARY KEY, lat REAL, lon REAL, ts REAL)"
+    )
+    return conn
+
+
+@functools.lru_cache(maxsize=4096)
+def geocode_place(place: str, cache_path: str = ".geocode_cache.sqlite3") -> tuple[float, float]:
+    """Geocode a human-readable place string to (lat, lon).
+
+    Results are memoized in-process and persisted in a sqlite table, so a hit
+    is one indexed SELECT and a miss appends a single row.
+    """
     from geopy.geocoders import ArcGIS
 
-    cache: dict[str, Any] = {}
-    if os.path.exists(cache_path):
-        try:
-            cache = json.loads(open(cache_path, encoding="utf-8").read())
-        except Exception:
-            cache = {}
-
-    if place in cache:
-        return float(cache[place]["lat"]), float(cache[place]["lon"])
-
-    # Use ArcGIS (free, no API key required)
-    geolocator = ArcGIS(timeout=20)
-    loc = geolocator.geocode(place, exactly_one=True)
-    if loc is None:
-        raise RuntimeError(f"Could not geocode place: {place!r}")
-
-    lat, lon = float(loc.latitude), float(loc.longitude)
-    cache[place] = {"lat": lat, "lon": lon, "ts": time.time()}
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2, sort_keys=True)
+    with closing(_geocode_db(cache_path)) as conn:
+        row = conn.execute("SELECT lat, lon FROM geo WHERE place = ?", (place,)).fetchone()
+        if row is not None:
+            return float(row[0]), float(row[1])
+
+        # Use ArcGIS (free, no API key required)
+        geolocator = ArcGIS(timeout=20)
+        loc = geolocator.geocode(place, exactly_one=True)
+        if loc is None:
+            raise RuntimeError(f"Could not geocode place: {place!r}")
+
+        lat, lon = float(loc.latitude), float(loc.longitude)
+        conn.execute(
+            "INSERT OR REPLACE INTO geo (place, lat, lon, ts) VALUES (?, ?, ?, ?)",
+            (place, lat, lon, time.time()),
+        )
     return lat, lon
 
 
+@functools.lru_cache(maxsize=1)
+def _get_timezone_finder() -> Any:
+    """Build the TimezoneFinder (which opens its polygon data) once per process."""
+    from timezonefinder import TimezoneFinder
+
+    return TimezoneFinder()
+
+
 def timezone_for_latlon(lat: float, lon: float) -> str:
-    tf = TimezoneFinder()
-    tz = tf.timezone_at(lat=lat, lng=lon)
+    tz = _get_timezone_finder().timezone_at(lat=lat, lng=lon)
     if not tz:
         raise RuntimeError(f"Could not resolve timezone for lat/lon: {lat}, {lon}")
     return tz
@@ -272,6 +173,68 @@ def jd_from_utc(dt_utc: datetime) -> float:
     return float(swe.julday(y, m, d, hour, swe.GREG_CAL))
 
 
+# Bodies read straight from the ephemeris by activations_for_jd. Earth is not
+# here: geocentrically it is simply opposite the Sun.
+_EPHEMERIS_BODIES: tuple[tuple[str, int], ...] = (
+    ("Sun", swe.SUN),
+    ("Moon", swe.MOON),
+    ("TrueNode", swe.TRUE_NODE),
+    ("Mercury", swe.MERCURY),
+    ("Venus", swe.VENUS),
+    ("Mars", swe.MARS),
+    ("Jupiter", swe.JUPITER),
+    ("Saturn", swe.SATURN),
+    ("Uranus", swe.URANUS),
+    ("Neptune", swe.NEPTUNE),
+    ("Pluto", swe.PLUTO),
+)
+
+# Output activations in chart order as (planet, index into _EPHEMERIS_BODIES,
+# offset in degrees). Earth and SouthNode sit opposite Sun and TrueNode.
+_CHART_POINTS: tuple[tuple[str, int, float], ...] = (
+    ("Sun", 0, 0.0),
+    ("Earth", 0, 180.0),
+    ("Moon", 1, 0.0),
+    ("TrueNode", 2, 0.0),
+    ("SouthNode", 2, 180.0),
+    ("Mercury", 3, 0.0),
+    ("Venus", 4, 0.0),
+    ("Mars", 5, 0.0),
+    ("Jupiter", 6, 0.0),
+    ("Saturn", 7, 0.0),
+    ("Uranus", 8, 0.0),
+    ("Neptune", 9, 0.0),
+    ("Pluto", 10, 0.0),
+)
+
+# Nothing on the chart path needs speed; calc_lon_ut keeps FLG_SPEED for
+# callers that want it.
+_FLAGS_FAST = swe.FLG_SWIEPH
+_FLAGS_SPEED = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# Mean apparent motion of the Sun, degrees per day.
+_SUN_MEAN_MOTION = 0.98565
+
+# Resolve the ephemeris path once at import rather than on the first calc.
+swe.set_ephe_path(os.environ.get("SE_EPHE_PATH"))
+
+
+@functools.lru_cache(maxsize=8192)
+def _lon_only(jd_ut: float, body: int) -> float:
+    """Return longitude_deg only (no speed requested from the ephemeris).
+
+    Memoized per process, so recomputing a chart for the same moment (retries,
+    reloads on a warm Lambda) skips the ephemeris entirely.
+    """
+    return swe.calc_ut(jd_ut, body, _FLAGS_FAST)[0][0] % 360.0
+
+
+def _lon_speed(jd_ut: float, body: int) -> tuple[float, float]:
+    """Return (longitude_deg, speed_deg_per_day)."""
+    (xx, _retflag) = swe.calc_ut(jd_ut, body, _FLAGS_SPEED)
+    return _norm360(float(xx[0])), float(xx[3])  # deg/day (with FLG_SPEED)
+
+
 def calc_lon_ut(jd_ut: float, body: int) -> tuple[float, float]:
     """Return (longitude_deg, speed_deg_per_day).
 
@@ -279,11 +242,7 @@ def calc_lon_ut(jd_ut: float, body: int) -> tuple[float, float]:
         jd_ut: Julian Day (JD) in Universal Time (UT).
         body: Swiss Ephemeris body constant.
     """
-    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
-    (xx, _retflag) = swe.calc_ut(jd_ut, body, flags)
-    lon = float(xx[0])
-    speed = float(xx[3])  # deg/day (with FLG_SPEED)
-    return _norm360(lon), speed
+    return _lon_speed(jd_ut, body)
 
 
 def find_design_jd(birth_jd: float, birth_sun_lon: float) -> float:
@@ -300,17 +259,20 @@ def find_design_jd(birth_jd: float, birth_sun_lon: float) -> float:
     """
     target = _norm360(birth_sun_lon - 88.0)
 
-    # Start near ~88 days earlier (close enough for Newton iteration).
-    jd = birth_jd - 88.0
+    # Start from the mean solar motion; the true speed stays within ~3% of it.
+    jd = birth_jd - 88.0 / _SUN_MEAN_MOTION
+    slope = _SUN_MEAN_MOTION
 
-    # Newton-ish iteration using sun speed.
-    for _ in range(20):
-        lon, speed = calc_lon_ut(jd, swe.SUN)
-        err = _angdiff_signed(lon, target)  # lon - target
+    # Secant iteration: longitude only, slope refined from the last two points.
+    prev_jd = prev_err = None
+    for _ in range(8):
+        err = _angdiff_signed(_lon_only(jd, swe.SUN), target)  # lon - target
         if abs(err) < 1e-6:
             break
-        # Step in days. speed is ~1 deg/day, so this is stable.
-        jd -= err / (speed if speed != 0 else 0.9856)
+        if prev_err is not None and err != prev_err:
+            slope = (err - prev_err) / (jd - prev_jd)
+        prev_jd, prev_err = jd, err
+        jd -= err / slope
 
     return jd
 
@@ -325,96 +287,40 @@ def gate_line_from_longitude(lon: float) -> tuple[int, int]:
       offset_in_gate / (gate_span/6)
     """
     lon = _norm360(lon)
+    if not 0.0 <= lon < 360.0:
+        raise RuntimeError(f"No gate range found for longitude {lon}")
+
+    # Bucket lookup, then step into the next segment if lon is past its start.
+    i = BUCKET_FIRST_SEGMENT[int(lon)]
+    if i + 1 < len(SEGMENT_STARTS) and lon >= SEGMENT_STARTS[i + 1]:
+        i += 1
+    gate, start, end = SEGMENTS[i]
 
-    # Find gate range that contains lon.
-    for gate, start, end in GATE_RANGES:
-        if start <= end:
-            if start <= lon < end:
-                span = end - start
-                offset = lon - start
-                line = int(math.floor(offset / (span / 6.0))) + 1
-                return gate, min(max(line, 1), 6)
-        else:
-            # wrap range, should not occur in our built list (we split wraps),
-            # but keep robust.
-            if lon >= start or lon < end:
-                span = (360.0 - start) + end
-                offset = (lon - start) if lon >= start else ((360.0 - start) + lon)
-                line = int(math.floor(offset / (span / 6.0))) + 1
-                return gate, min(max(line, 1), 6)
-
-    raise RuntimeError(f"No gate range found for longitude {lon}")
+    span = end - start
+    offset = lon - start
+    line = int(math.floor(offset / (span / 6.0))) + 1
+    return gate, min(max(line, 1), 6)
 
 
 def activations_for_jd(jd_ut: float) -> list[Activation]:
     """Calculate planetary activations at a given Julian Day (JD).
 
+    All ephemeris longitudes are read in one pass; Earth and SouthNode are
+    derived arithmetically from Sun and TrueNode.
+
     Args:
         jd_ut: Julian Day (JD) in Universal Time (UT).
 
     Returns:
         List of Activation objects for all relevant planets and nodes.
     """
-    planets: list[tuple[str, int]] = [
-        ("Sun", swe.SUN),
-        ("Earth", swe.EARTH),
-        ("Moon", swe.MOON),
-        ("Mercury", swe.MERCURY),
-        ("Venus", swe.VENUS),
-        ("Mars", swe.MARS),
-        ("Jupiter", swe.JUPITER),
-        ("Saturn", swe.SATURN),
-        ("Uranus", swe.URANUS),
-        ("Neptune", swe.NEPTUNE),
-        ("Pluto", swe.PLUTO),
-        ("TrueNode", swe.TRUE_NODE),
-    ]
+    lons = [_lon_only(jd_ut, body) for _, body in _EPHEMERIS_BODIES]
 
-    out: list[Activation] = []
-
-    # Sun
-    sun_lon, _ = calc_lon_ut(jd_ut, swe.SUN)
-    sun_gate, sun_line = gate_line_from_longitude(sun_lon)
-    out.append(Activation("Sun", sun_lon, sun_gate, sun_line))
-
-    # Earth = opposite Sun
-    earth_lon = _norm360(sun_lon + 180.0)
-    earth_gate, earth_line = gate_line_from_longitude(earth_lon)
-    out.append(Activation("Earth", earth_lon, earth_gate, earth_line))
-
-    # Other planets
-    for name, body in planets:
-        if name == "Sun":
-            continue
-        lon, _ = calc_lon_ut(jd_ut, body)
-        gate, line = gate_line_from_longitude(lon)
-        out.append(Activation(name, lon, gate, line))
-
-    # South node opposite TrueNode
-    for act in out:
-        if act.planet == "TrueNode":
-            sn_lon = _norm360(act.longitude + 180.0)
-            sn_gate, sn_line = gate_line_from_longitude(sn_lon)
-            out.append(Activation("SouthNode", sn_lon, sn_gate, sn_line))
-            break
-
-    # Stable order
-    order = {
-        "Sun": 0,
-        "Earth": 1,
-        "Moon": 2,
-        "TrueNode": 3,
-        "SouthNode": 4,
-        "Mercury": 5,
-        "Venus": 6,
-        "Mars": 7,
-        "Jupiter": 8,
-        "Saturn": 9,
-        "Uranus": 10,
-        "Neptune": 11,
-        "Pluto": 12,
-    }
-    out.sort(key=lambda a: order.get(a.planet, 999))
+    # Built directly in chart order, so no sort is needed.
+    out = []
+    for planet, idx, offset in _CHART_POINTS:
+        lon = _norm360(lons[idx] + offset)
+        out.append(Activation(planet, lon, *gate_line_from_longitude(lon)))
     return out
 
 
@@ -474,7 +380,7 @@ def main() -> int:
     birth_jd = jd_from_utc(dt_utc)
 
     # Birth Sun longitude
-    birth_sun_lon, _ = calc_lon_ut(birth_jd, swe.SUN)
+    birth_sun_lon = _lon_only(birth_jd, swe.SUN)
 
     # Design Julian Day (JD) by 88° solar longitude offset
     design_jd = find_design_jd(birth_jd, birth_sun_lon)
@@ -503,7 +409,10 @@ def main() -> int:
         "design": activation_dict(design),
     }
 
-    text = json.dumps(out, indent=2, sort_keys=False)
+    if HAS_ORJSON:
+        text = orjson.dumps(out, option=orjson.OPT_INDENT_2).decode()
+    else:
+        text = json.dumps(out, indent=2, sort_keys=False)
     if args.out:
         with open(args.out, "w", encoding="utf-8") as f:
             f.write(text + "\n")
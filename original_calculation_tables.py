@@ -0,0 +1,178 @@
+"""Gate lookup tables for original_calculation.py.
+
+GENERATED by scripts/generate_gate_tables.py -- do not edit by hand.
+"""
+
+# (gate, start_deg, end_deg) in source order; Gate 25 wraps as two segments.
+GATE_RANGES: tuple[tuple[int, float, float], ...] = (
+    (25, 358.25, 360.0),
+    (25, 0.0, 3.875),
+    (17, 3.875, 9.5),
+    (21, 9.5, 15.125),
+    (51, 15.125, 20.75),
+    (42, 20.75, 26.375),
+    (3, 26.375, 32.0),
+    (27, 32.0, 37.625),
+    (24, 37.625, 43.25),
+    (2, 43.25, 48.875),
+    (23, 48.875, 54.5),
+    (8, 54.5, 60.125),
+    (20, 60.125, 65.75),
+    (16, 65.75, 71.375),
+    (35, 71.375, 77.0),
+    (45, 77.0, 82.45833333333334),
+    (12, 82.45833333333334, 88.25),
+    (15, 88.25, 93.875),
+    (52, 93.875, 99.5),
+    (39, 99.5, 105.125),
+    (53, 105.125, 110.75),
+    (62, 110.75, 116.375),
+    (56, 116.375, 122.0),
+    (31, 122.0, 127.625),
+    (33, 127.625, 133.25),
+    (7, 133.25, 138.875),
+    (4, 138.875, 144.5),
+    (29, 144.5, 150.125),
+    (59, 150.125, 155.75),
+    (40, 155.75, 161.375),
+    (64, 161.375, 167.0),
+    (47, 167.0, 172.45833333333331),
+    (6, 172.45833333333331, 178.25),
+    (46, 178.25, 183.875),
+    (18, 183.875, 189.5),
+    (48, 189.5, 195.125),
+    (57, 195.125, 200.75),
+    (32, 200.75, 206.375),
+    (50, 206.375, 212.0),
+    (28, 212.0, 217.625),
+    (44, 217.625, 223.25),
+    (1, 223.25, 228.875),
+    (43, 228.875, 234.5),
+    (14, 234.5, 240.125),
+    (34, 240.125, 245.75),
+    (9, 245.75, 251.375),
+    (5, 251.375, 257.0),
+    (26, 257.0, 262.4583333333333),
+    (11, 262.4583333333333, 268.25),
+    (10, 268.25, 273.875),
+    (58, 273.875, 279.5),
+    (38, 279.5, 285.125),
+    (54, 285.125, 290.75),
+    (61, 290.75, 296.375),
+    (60, 296.375, 302.0),
+    (41, 302.0, 307.625),
+    (19, 307.625, 313.25),
+    (13, 313.25, 318.875),
+    (49, 318.875, 324.5),
+    (30, 324.5, 330.125),
+    (55, 330.125, 335.75),
+    (37, 335.75, 341.375),
+    (63, 341.375, 347.0),
+    (22, 347.0, 352.4583333333333),
+    (36, 352.4583333333333, 358.25),
+)
+
+# GATE_RANGES sorted by start degree.
+SEGMENTS: tuple[tuple[int, float, float], ...] = (
+    (25, 0.0, 3.875),
+    (17, 3.875, 9.5),
+    (21, 9.5, 15.125),
+    (51, 15.125, 20.75),
+    (42, 20.75, 26.375),
+    (3, 26.375, 32.0),
+    (27, 32.0, 37.625),
+    (24, 37.625, 43.25),
+    (2, 43.25, 48.875),
+    (23, 48.875, 54.5),
+    (8, 54.5, 60.125),
+    (20, 60.125, 65.75),
+    (16, 65.75, 71.375),
+    (35, 71.375, 77.0),
+    (45, 77.0, 82.45833333333334),
+    (12, 82.45833333333334, 88.25),
+    (15, 88.25, 93.875),
+    (52, 93.875, 99.5),
+    (39, 99.5, 105.125),
+    (53, 105.125, 110.75),
+    (62, 110.75, 116.375),
+    (56, 116.375, 122.0),
+    (31, 122.0, 127.625),
+    (33, 127.625, 133.25),
+    (7, 133.25, 138.875),
+    (4, 138.875, 144.5),
+    (29, 144.5, 150.125),
+    (59, 150.125, 155.75),
+    (40, 155.75, 161.375),
+    (64, 161.375, 167.0),
+    (47, 167.0, 172.45833333333331),
+    (6, 172.45833333333331, 178.25),
+    (46, 178.25, 183.875),
+    (18, 183.875, 189.5),
+    (48, 189.5, 195.125),
+    (57, 195.125, 200.75),
+    (32, 200.75, 206.375),
+    (50, 206.375, 212.0),
+    (28, 212.0, 217.625),
+    (44, 217.625, 223.25),
+    (1, 223.25, 228.875),
+    (43, 228.875, 234.5),
+    (14, 234.5, 240.125),
+    (34, 240.125, 245.75),
+    (9, 245.75, 251.375),
+    (5, 251.375, 257.0),
+    (26, 257.0, 262.4583333333333),
+    (11, 262.4583333333333, 268.25),
+    (10, 268.25, 273.875),
+    (58, 273.875, 279.5),
+    (38, 279.5, 285.125),
+    (54, 285.125, 290.75),
+    (61, 290.75, 296.375),
+    (60, 296.375, 302.0),
+    (41, 302.0, 307.625),
+    (19, 307.625, 313.25),
+    (13, 313.25, 318.875),
+    (49, 318.875, 324.5),
+    (30, 324.5, 330.125),
+    (55, 330.125, 335.75),
+    (37, 335.75, 341.375),
+    (63, 341.375, 347.0),
+    (22, 347.0, 352.4583333333333),
+    (36, 352.4583333333333, 358.25),
+    (25, 358.25, 360.0),
+)
+
+SEGMENT_STARTS: tuple[float, ...] = (
+    0.0, 3.875, 9.5, 15.125, 20.75, 26.375,
+    32.0, 37.625, 43.25, 48.875, 54.5, 60.125,
+    65.75, 71.375, 77.0, 82.45833333333334, 88.25, 93.875,
+    99.5, 105.125, 110.75, 116.375, 122.0, 127.625,
+    133.25, 138.875, 144.5, 150.125, 155.75, 161.375,
+    167.0, 172.45833333333331, 178.25, 183.875, 189.5, 195.125,
+    200.75, 206.375, 212.0, 217.625, 223.25, 228.875,
+    234.5, 240.125, 245.75, 251.375, 257.0, 262.4583333333333,
+    268.25, 273.875, 279.5, 285.125, 290.75, 296.375,
+    302.0, 307.625, 313.25, 318.875, 324.5, 330.125,
+    335.75, 341.375, 347.0, 352.4583333333333, 358.25,
+)
+
+# Index into SEGMENTS of the segment containing each whole degree.
+BUCKET_FIRST_SEGMENT: tuple[int, ...] = (
+    0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3,
+    3, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 6, 6, 6, 6, 6, 6, 7, 7,
+    7, 7, 7, 7, 8, 8, 8, 8, 8, 9, 9, 9, 9, 9, 9, 10, 10, 10, 10, 10,
+    10, 11, 11, 11, 11, 11, 12, 12, 12, 12, 12, 12, 13, 13, 13, 13, 13, 14, 14, 14,
+    14, 14, 14, 15, 15, 15, 15, 15, 15, 16, 16, 16, 16, 16, 17, 17, 17, 17, 17, 17,
+    18, 18, 18, 18, 18, 18, 19, 19, 19, 19, 19, 20, 20, 20, 20, 20, 20, 21, 21, 21,
+    21, 21, 22, 22, 22, 22, 22, 22, 23, 23, 23, 23, 23, 23, 24, 24, 24, 24, 24, 25,
+    25, 25, 25, 25, 25, 26, 26, 26, 26, 26, 26, 27, 27, 27, 27, 27, 28, 28, 28, 28,
+    28, 28, 29, 29, 29, 29, 29, 30, 30, 30, 30, 30, 30, 31, 31, 31, 31, 31, 31, 32,
+    32, 32, 32, 32, 33, 33, 33, 33, 33, 33, 34, 34, 34, 34, 34, 34, 35, 35, 35, 35,
+    35, 36, 36, 36, 36, 36, 36, 37, 37, 37, 37, 37, 38, 38, 38, 38, 38, 38, 39, 39,
+    39, 39, 39, 39, 40, 40, 40, 40, 40, 41, 41, 41, 41, 41, 41, 42, 42, 42, 42, 42,
+    42, 43, 43, 43, 43, 43, 44, 44, 44, 44, 44, 44, 45, 45, 45, 45, 45, 46, 46, 46,
+    46, 46, 46, 47, 47, 47, 47, 47, 47, 48, 48, 48, 48, 48, 49, 49, 49, 49, 49, 49,
+    50, 50, 50, 50, 50, 50, 51, 51, 51, 51, 51, 52, 52, 52, 52, 52, 52, 53, 53, 53,
+    53, 53, 54, 54, 54, 54, 54, 54, 55, 55, 55, 55, 55, 55, 56, 56, 56, 56, 56, 57,
+    57, 57, 57, 57, 57, 58, 58, 58, 58, 58, 58, 59, 59, 59, 59, 59, 60, 60, 60, 60,
+    60, 60, 61, 61, 61, 61, 61, 62, 62, 62, 62, 62, 62, 63, 63, 63, 63, 63, 63, 64,
+)
@@ -8,7 +8,8 @@ import tempfile
 from pathlib import Path
 from datetime import datetime
 from urllib.parse import urlparse
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+import ctranslate2
 import boto3
 from botocore.exceptions import ClientError
 
@@ -20,6 +21,15 @@ sys.stderr.reconfigure(line_buffering=True)
 DYNAMODB_TABLE = os.environ.get("DYNAMODB_TABLE", "RaTranscriptionJobs")
 AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
 
+# VAD chunks fed to the encoder per batch (8 fits <=8 GB VRAM; 16 for 24 GB)
+BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "8"))
+
+# Echo every decoded segment to stdout (line-buffered, so each print flushes)
+VERBOSE = os.environ.get("VERBOSE", "") not in ("", "0")
+
+# Compact JSON for transcript files; the .txt transcript is the readable copy
+JSON_SEPARATORS = (",", ":")
+
 # Initialize AWS clients
 s3_client = boto3.client("s3", region_name=AWS_REGION)
 dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
@@ -38,6 +48,31 @@ triple split, quadruple split, no definition, lines, colors, tones, bases.
 """
 
 
+def resolve_device(device: str = "auto", compute_type: str = "auto") -> tuple[str, str]:
+    """Resolve "auto" device/compute_type to what this machine can run.
+
+    On a CUDA GPU, compute_type "auto" lets CTranslate2 pick the fastest type
+    the card supports (float16 on Turing+, int8_float16 otherwise). Without a
+    GPU we fall back to cpu/int8.
+    """
+    if device == "auto":
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if compute_type == "auto" and device == "cpu":
+        compute_type = "int8"
+    return device, compute_type
+
+
+def gpu_index_for_worker() -> int:
+    """GPU this worker should use when several run side by side on one host.
+
+    Workers are numbered through WORKER_ID (or AWS_BATCH_JOB_ARRAY_INDEX for
+    Batch array jobs) and spread round-robin over the visible GPUs, so each
+    process owns its own CTranslate2 context instead of piling onto GPU 0.
+    """
+    worker_id = int(os.environ.get("WORKER_ID", os.environ.get("AWS_BATCH_JOB_ARRAY_INDEX", "0")))
+    return worker_id % max(ctranslate2.get_cuda_device_count(), 1)
+
+
 def parse_s3_uri(s3_uri: str) -> tuple[str, str]:
     """Parse S3 URI into bucket and key"""
     parsed = urlparse(s3_uri)
@@ -102,7 +137,7 @@ def update_file_status(job_id: str, file_id: str, status: str, **kwargs) -> None
 
 
 def transcribe_file_from_s3(
-    model: WhisperModel,
+    model: BatchedInferencePipeline,
     input_s3_uri: str,
     output_s3_base: str,
     job_id: str,
@@ -129,33 +164,26 @@ def transcribe_file_from_s3(
 
             start_time = datetime.now()
 
-            # Transcribe with VAD filtering and HD terminology prompt
+            # Transcribe with VAD filtering and HD terminology prompt; VAD chunks
+            # are batched through the encoder
             segments, info = model.transcribe(
                 str(local_audio),
+                batch_size=BATCH_SIZE,
+                # The batched pipeline decodes each chunk once (no temperature
+                # fallback, no conditioning on previous text), so beam search
+                # is what guards against repetition loops
                 beam_size=5,
+                # Segment timestamps only; skip the word-alignment pass
+                word_timestamps=False,
                 vad_filter=True,
                 initial_prompt=HD_PROMPT,
             )
 
-            # Collect segments
-            all_segments = []
-            full_text_lines = []
-
-            for segment in segments:
-                seg_data = {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip()
-                }
-                all_segments.append(seg_data)
-                full_text_lines.append(
-                    f"[{segment.start:.2f}s -> {segment.end:.2f}s] {segment.text.strip()}"
-                )
-                print(f"[{segment.start:.2f}s -> {segment.end:.2f}s] {segment.text.strip()}")
-
-            elapsed = (datetime.now() - start_time).total_seconds()
+            # Stream segments to both output files as the generator yields
+            # them, so the transcript is never held in memory as a whole
+            json_path = tmpdir_path / f"{file_id}.json"
+            txt_path = tmpdir_path / f"{file_id}.txt"
 
-            # Prepare result
             result = {
                 "file_id": file_id,
                 "job_id": job_id,
@@ -163,25 +191,48 @@ def transcribe_file_from_s3(
                 "language": info.language,
                 "language_probability": info.language_probability,
                 "duration_seconds": info.duration,
-                "transcription_time_seconds": elapsed,
-                "segments": all_segments
             }
 
-            # Save outputs to temporary files
-            json_path = tmpdir_path / f"{file_id}.json"
-            txt_path = tmpdir_path / f"{file_id}.txt"
-
-            # Save JSON with metadata and timestamps
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-
-            # Save plain text with timestamps
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(f"# File: {file_id}\n")
-                f.write(f"# Job: {job_id}\n")
-                f.write(f"# Language: {info.language} (confidence: {info.language_probability:.2%})\n")
-                f.write(f"# Duration: {info.duration:.1f}s\n\n")
-                f.write("\n".join(full_text_lines))
+            with open(json_path, "w", encoding="utf-8") as json_file, \
+                    open(txt_path, "w", encoding="utf-8") as txt_file:
+                # JSON with metadata and timestamps: the header object minus its
+                # closing brace, then one segment per line
+                header = json.dumps(result, ensure_ascii=False, separators=JSON_SEPARATORS)
+                json_file.write(header[:-1])
+                json_file.write(',"segments":[\n')
+
+                # Plain text with timestamps
+                txt_file.write(f"# File: {file_id}\n")
+                txt_file.write(f"# Job: {job_id}\n")
+                txt_file.write(
+                    f"# Language: {info.language}"
+                    f" (confidence: {info.language_probability:.2%})\n"
+                )
+                txt_file.write(f"# Duration: {info.duration:.1f}s\n\n")
+
+                first = True
+                for segment in segments:
+                    text = segment.text.strip()
+                    seg_data = {
+                        "start": segment.start,
+                        "end": segment.end,
+                        "text": text
+                    }
+                    if not first:
+                        json_file.write(",\n")
+                        txt_file.write("\n")
+                    first = False
+                    json_file.write(
+                        json.dumps(seg_data, ensure_ascii=False, separators=JSON_SEPARATORS)
+                    )
+                    line = f"[{segment.start:.2f}s -> {segment.end:.2f}s] {text}"
+                    txt_file.write(line)
+                    if VERBOSE:
+                        print(line)
+
+                elapsed = (datetime.now() - start_time).total_seconds()
+                result["transcription_time_seconds"] = elapsed
+                json_file.write(f'\n],"transcription_time_seconds":{json.dumps(elapsed)}}}\n')
 
             # Upload to S3
             # Ensure output_s3_base ends with /
@@ -218,36 +269,52 @@ def transcribe_file_from_s3(
             raise
 
 
+def load_pipeline(model_name: str, device: str, compute_type: str) -> BatchedInferencePipeline:
+    """Load the Whisper model (device/compute_type already resolved) and wrap it for batching"""
+    print(f"\nLoading model: {model_name}...")
+    load_start = datetime.now()
+    model = WhisperModel(
+        model_name,
+        device=device,
+        device_index=gpu_index_for_worker() if device == "cuda" else 0,
+        compute_type=compute_type,
+    )
+    pipeline = BatchedInferencePipeline(model=model)
+    model_load_time = (datetime.now() - load_start).total_seconds()
+    print(f"Model loaded in {model_load_time:.1f}s!\n")
+    return pipeline
+
+
 def transcribe_from_batch(
     input_s3_uri: str,
     output_s3_base: str,
     job_id: str,
     file_id: str,
-    model_name: str = "large-v3"
+    model_name: str = "large-v3",
+    device: str = "auto",
+    compute_type: str = "auto",
 ):
     """Transcribe single audio file from S3 (AWS Batch worker)"""
 
+    device, compute_type = resolve_device(device, compute_type)
+
     print(f"\n{'#'*60}")
     print(f"# AWS BATCH TRANSCRIPTION WORKER")
     print(f"# Input: {input_s3_uri}")
     print(f"# Output: {output_s3_base}")
     print(f"# Job ID: {job_id}")
     print(f"# File ID: {file_id}")
-    print(f"# Model: {model_name} (CPU)")
+    print(f"# Model: {model_name} ({device}, {compute_type})")
     print(f"# DynamoDB Table: {DYNAMODB_TABLE}")
     print(f"{'#'*60}")
 
-    # Load model
-    print(f"\nLoading model: {model_name}...")
     total_start = datetime.now()
-    model = WhisperModel(model_name, device="cpu", compute_type="int8")
-    model_load_time = (datetime.now() - total_start).total_seconds()
-    print(f"Model loaded in {model_load_time:.1f}s!\n")
+    pipeline = load_pipeline(model_name, device, compute_type)
 
     # Transcribe
     try:
         result = transcribe_file_from_s3(
-            model, input_s3_uri, output_s3_base, job_id, file_id
+            pipeline, input_s3_uri, output_s3_base, job_id, file_id
         )
         total_elapsed = (datetime.now() - total_start).total_seconds()
 
@@ -271,14 +338,79 @@ def transcribe_from_batch(
         return 1
 
 
+def serve(model_name: str = "large-v3", device: str = "auto", compute_type: str = "auto") -> int:
+    """Long-lived worker: load the model once, then transcribe jobs read from stdin.
+
+    Each stdin line is a JSON job
+    {"input_s3_uri": ..., "output_s3_uri": ..., "job_id": ..., "file_id": ...}.
+    One JSON result line per job is written to stdout; progress logs go to
+    stderr so the result stream stays machine-readable.
+    """
+    results = sys.stdout
+    sys.stdout = sys.stderr
+
+    device, compute_type = resolve_device(device, compute_type)
+    print(f"# SERVE MODE: {model_name} ({device}, {compute_type})")
+    pipeline = load_pipeline(model_name, device, compute_type)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job: dict = {}
+        try:
+            job = json.loads(line)
+            result = transcribe_file_from_s3(
+                pipeline, job["input_s3_uri"], job["output_s3_uri"], job["job_id"], job["file_id"]
+            )
+            reply = {
+                "job_id": job["job_id"],
+                "file_id": job["file_id"],
+                "status": "completed",
+                "duration_seconds": result["duration_seconds"],
+                "transcription_time_seconds": result["transcription_time_seconds"],
+            }
+        except Exception as e:
+            reply = {
+                "job_id": job.get("job_id"),
+                "file_id": job.get("file_id"),
+                "status": "failed",
+                "error": str(e),
+            }
+        results.write(json.dumps(reply) + "\n")
+        results.flush()
+
+    return 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        sys.exit(serve(*sys.argv[2:5]))
+
     if len(sys.argv) < 5:
-        print("Usage: python parallel_transcribe.py <input_s3_uri> <output_s3_uri> <job_id> <file_id> [model_name]")
-        print("Example: python parallel_transcribe.py s3://bucket/input.mp3 s3://bucket/output/ job_123 file_456 large-v3")
+        print(
+            "Usage: python parallel_transcribe.py <input_s3_uri> <output_s3_uri> <job_id> <file_id>"
+            " [model_name] [device] [compute_type]"
+        )
+        print(
+            "       python parallel_transcribe.py --serve [model_name] [device] [compute_type]"
+            " < jobs.jsonl"
+        )
+        print(
+            "Example: python parallel_transcribe.py s3://bucket/input.mp3 s3://bucket/output/"
+            " job_123 file_456 large-v3 auto auto"
+        )
+        print("")
+        print(
+            "device: auto (default), cuda or cpu;"
+            " compute_type: auto (default), float16, int8_float16, int8, ..."
+        )
         print("")
         print("Environment variables:")
         print("  DYNAMODB_TABLE - DynamoDB table name (default: RaTranscriptionJobs)")
         print("  AWS_REGION - AWS region (default: us-east-1)")
+        print("  BATCH_SIZE - VAD chunks per encoder batch (default: 8)")
+        print("  WORKER_ID - worker number, used to pick a GPU on multi-GPU hosts (default: 0)")
+        print("  VERBOSE - set to 1 to print every segment as it is decoded (default: off)")
         sys.exit(1)
 
     input_s3_uri = sys.argv[1]
@@ -286,8 +418,10 @@ if __name__ == "__main__":
     job_id = sys.argv[3]
     file_id = sys.argv[4]
     model_name = sys.argv[5] if len(sys.argv) > 5 else "large-v3"
+    device = sys.argv[6] if len(sys.argv) > 6 else "auto"
+    compute_type = sys.argv[7] if len(sys.argv) > 7 else "auto"
 
     exit_code = transcribe_from_batch(
-        input_s3_uri, output_s3_base, job_id, file_id, model_name
+        input_s3_uri, output_s3_base, job_id, file_id, model_name, device, compute_type
     )
     sys.exit(exit_code)
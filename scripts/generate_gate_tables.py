@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Regenerate original_calculation_tables.py from the gate-by-degree table.
+
+Usage:
+  python scripts/generate_gate_tables.py
+
+The generated module holds the gate table and its lookup index as plain tuple
+literals, so importing original_calculation.py does no table arithmetic.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+OUTPUT = Path(__file__).resolve().parent.parent / "original_calculation_tables.py"
+
+# -------------------------
+# Gate-by-degree mapping
+# -------------------------
+# Source table format:
+# Each entry is (gate, start_deg, end_deg) on the tropical zodiac circle,
+# where degrees are absolute [0, 360) with 0 = 0° Aries.
+#
+# The Barney+flow "gates by degrees" page provides these ranges by sign
+# in degrees+minutes+seconds. We encode them here in decimal degrees.
+#
+# IMPORTANT: This list must cover the full 360° without gaps/overlaps.
+#            If you want, you can regenerate this list programmatically
+#            from a scraped/structured source, but this keeps it simple
+#            and offline once installed.
+#
+# Ranges are [start, end) going forward; wrap-around handled separately.
+#
+# Aries starts at 0°, Taurus 30°, Gemini 60°, ... Pisces 330°.
+#
+# NOTE: The Barney+flow page uses ranges like "28°15' Pisces – 03°52'30\" Aries".
+#       That implies wrap-around across 360°. We encode those as two segments
+#       (e.g., Pisces 28.25°..30°, Aries 0°..3.875°).
+#
+# For brevity, we include the full 64-gate coverage.
+#
+# If you spot a mismatch with your favorite calculator, the usual culprits are:
+# - sidereal vs tropical (Human Design uses tropical)
+# - different ephemeris settings / node type
+# - rounding at exact boundaries
+GATE_RANGES: list[tuple[int, float, float]] = []
+
+
+def _d(sign_base: float, deg: int, minutes: int = 0, seconds: int = 0) -> float:
+    return sign_base + deg + minutes / 60.0 + seconds / 3600.0
+
+
+def _add(gate: int, start: float, end: float) -> None:
+    GATE_RANGES.append((gate, start, end))
+
+
+def _build_gate_ranges() -> None:
+    # Sign bases:
+    ar, ta, ge, ca, le, vi, li, sc, sg, cp, aq, pi = (
+        0.0,
+        30.0,
+        60.0,
+        90.0,
+        120.0,
+        150.0,
+        180.0,
+        210.0,
+        240.0,
+        270.0,
+        300.0,
+        330.0,
+    )
+
+    # --- ARIES (0..30) ---
+    # Gate 25: 28°15' Pisces -> 3°52'30 Aries (wrap)
+    _add(25, _d(pi, 28, 15, 0), 360.0)
+    _add(25, 0.0, _d(ar, 3, 52, 30))
+    _add(17, _d(ar, 3, 52, 30), _d(ar, 9, 30, 0))
+    _add(21, _d(ar, 9, 30, 0), _d(ar, 15, 7, 30))
+    _add(51, _d(ar, 15, 7, 30), _d(ar, 20, 45, 0))
+    _add(42, _d(ar, 20, 45, 0), _d(ar, 26, 22, 30))
+    _add(3, _d(ar, 26, 22, 30), _d(ta, 2, 0, 0))  # extends into Taurus
+
+    # --- TAURUS (30..60) ---
+    _add(27, _d(ta, 2, 0, 0), _d(ta, 7, 37, 30))
+    _add(24, _d(ta, 7, 37, 30), _d(ta, 13, 15, 0))
+    _add(2, _d(ta, 13, 15, 0), _d(ta, 18, 52, 30))
+    _add(23, _d(ta, 18, 52, 30), _d(ta, 24, 30, 0))
+    _add(8, _d(ta, 24, 30, 0), _d(ge, 0, 7, 30))  # into Gemini
+
+    # --- GEMINI (60..90) ---
+    _add(20, _d(ge, 0, 7, 30), _d(ge, 5, 45, 0))
+    _add(16, _d(ge, 5, 45, 0), _d(ge, 11, 22, 30))
+    _add(35, _d(ge, 11, 22, 30), _d(ge, 17, 0, 0))
+    _add(45, _d(ge, 17, 0, 0), _d(ge, 22, 27, 30))
+    _add(12, _d(ge, 22, 27, 30), _d(ge, 28, 15, 0))
+    _add(15, _d(ge, 28, 15, 0), _d(ca, 3, 52, 30))  # into Cancer
+
+    # --- CANCER (90..120) ---
+    _add(52, _d(ca, 3, 52, 30), _d(ca, 9, 30, 0))
+    _add(39, _d(ca, 9, 30, 0), _d(ca, 15, 7, 30))
+    _add(53, _d(ca, 15, 7, 30), _d(ca, 20, 45, 0))
+    _add(62, _d(ca, 20, 45, 0), _d(ca, 26, 22, 30))
+    _add(56, _d(ca, 26, 22, 30), _d(le, 2, 0, 0))  # into Leo
+
+    # --- LEO (120..150) ---
+    _add(31, _d(le, 2, 0, 0), _d(le, 7, 37, 30))
+    _add(33, _d(le, 7, 37, 30), _d(le, 13, 15, 0))
+    _add(7, _d(le, 13, 15, 0), _d(le, 18, 52, 30))
+    _add(4, _d(le, 18, 52, 30), _d(le, 24, 30, 0))
+    _add(29, _d(le, 24, 30, 0), _d(vi, 0, 7, 30))  # into Virgo
+
+    # --- VIRGO (150..180) ---
+    _add(59, _d(vi, 0, 7, 30), _d(vi, 5, 45, 0))
+    _add(40, _d(vi, 5, 45, 0), _d(vi, 11, 22, 30))
+    _add(64, _d(vi, 11, 22, 30), _d(vi, 17, 0, 0))
+    _add(47, _d(vi, 17, 0, 0), _d(vi, 22, 27, 30))
+    _add(6, _d(vi, 22, 27, 30), _d(vi, 28, 15, 0))
+    _add(46, _d(vi, 28, 15, 0), _d(li, 3, 52, 30))  # into Libra
+
+    # --- LIBRA (180..210) ---
+    _add(18, _d(li, 3, 52, 30), _d(li, 9, 30, 0))
+    _add(48, _d(li, 9, 30, 0), _d(li, 15, 7, 30))
+    _add(57, _d(li, 15, 7, 30), _d(li, 20, 45, 0))
+    _add(32, _d(li, 20, 45, 0), _d(li, 26, 22, 30))
+    _add(50, _d(li, 26, 22, 30), _d(sc, 2, 0, 0))  # into Scorpio
+
+    # --- SCORPIO (210..240) ---
+    _add(28, _d(sc, 2, 0, 0), _d(sc, 7, 37, 30))
+    _add(44, _d(sc, 7, 37, 30), _d(sc, 13, 15, 0))
+    _add(1, _d(sc, 13, 15, 0), _d(sc, 18, 52, 30))
+    _add(43, _d(sc, 18, 52, 30), _d(sc, 24, 30, 0))
+    _add(14, _d(sc, 24, 30, 0), _d(sg, 0, 7, 30))  # into Sagittarius
+
+    # --- SAGITTARIUS (240..270) ---
+    _add(34, _d(sg, 0, 7, 30), _d(sg, 5, 45, 0))
+    _add(9, _d(sg, 5, 45, 0), _d(sg, 11, 22, 30))
+    _add(5, _d(sg, 11, 22, 30), _d(sg, 17, 0, 0))
+    _add(26, _d(sg, 17, 0, 0), _d(sg, 22, 27, 30))
+    _add(11, _d(sg, 22, 27, 30), _d(sg, 28, 15, 0))
+    _add(10, _d(sg, 28, 15, 0), _d(cp, 3, 52, 30))  # into Capricorn
+
+    # --- CAPRICORN (270..300) ---
+    _add(58, _d(cp, 3, 52, 30), _d(cp, 9, 30, 0))
+    _add(38, _d(cp, 9, 30, 0), _d(cp, 15, 7, 30))
+    _add(54, _d(cp, 15, 7, 30), _d(cp, 20, 45, 0))
+    _add(61, _d(cp, 20, 45, 0), _d(cp, 26, 22, 30))
+    _add(60, _d(cp, 26, 22, 30), _d(aq, 2, 0, 0))  # into Aquarius
+
+    # --- AQUARIUS (300..330) ---
+    _add(41, _d(aq, 2, 0, 0), _d(aq, 7, 37, 30))
+    _add(19, _d(aq, 7, 37, 30), _d(aq, 13, 15, 0))
+    _add(13, _d(aq, 13, 15, 0), _d(aq, 18, 52, 30))
+    _add(49, _d(aq, 18, 52, 30), _d(aq, 24, 30, 0))
+    _add(30, _d(aq, 24, 30, 0), _d(pi, 0, 7, 30))  # into Pisces
+
+    # --- PISCES (330..360) ---
+    _add(55, _d(pi, 0, 7, 30), _d(pi, 5, 45, 0))
+    _add(37, _d(pi, 5, 45, 0), _d(pi, 11, 22, 30))
+    _add(63, _d(pi, 11, 22, 30), _d(pi, 17, 0, 0))
+    _add(22, _d(pi, 17, 0, 0), _d(pi, 22, 27, 30))
+    _add(36, _d(pi, 22, 27, 30), _d(pi, 28, 15, 0))
+    # Remaining Pisces tail (28°15'..30°) is Gate 25 already added above.
+
+
+def _build_bucket_index(starts: tuple[float, ...]) -> tuple[int, ...]:
+    first: list[int] = []
+    i = 0
+    for deg in range(360):
+        while i + 1 < len(starts) and starts[i + 1] <= deg:
+            i += 1
+        first.append(i)
+    return tuple(first)
+
+
+def _format_rows(rows: Iterable[tuple[int, float, float]]) -> str:
+    return "".join(f"    ({gate}, {start!r}, {end!r}),\n" for gate, start, end in rows)
+
+
+def _format_flat(values: tuple[float | int, ...], per_line: int) -> str:
+    lines = []
+    for i in range(0, len(values), per_line):
+        lines.append("    " + ", ".join(repr(v) for v in values[i : i + per_line]) + ",")
+    return "\n".join(lines) + "\n"
+
+
+def render() -> str:
+    _build_gate_ranges()
+    segments = tuple(sorted(GATE_RANGES, key=lambda r: r[1]))
+    starts = tuple(start for _, start, _ in segments)
+    buckets = _build_bucket_index(starts)
+    return (
+        '"""Gate lookup tables for original_calculation.py.\n\n'
+        "GENERATED by scripts/generate_gate_tables.py -- do not edit by hand.\n"
+        '"""\n\n'
+        "# (gate, start_deg, end_deg) in source order; Gate 25 wraps as two segments.\n"
+        "GATE_RANGES: tuple[tuple[int, float, float], ...] = (\n"
+        + _format_rows(GATE_RANGES)
+        + ")\n\n"
+        "# GATE_RANGES sorted by start degree.\n"
+        "SEGMENTS: tuple[tuple[int, float, float], ...] = (\n"
+        + _format_rows(segments)
+        + ")\n\n"
+        "SEGMENT_STARTS: tuple[float, ...] = (\n"
+        + _format_flat(starts, 6)
+        + ")\n\n"
+        "# Index into SEGMENTS of the segment containing each whole degree.\n"
+        "BUCKET_FIRST_SEGMENT: tuple[int, ...] = (\n"
+        + _format_flat(buckets, 20)
+        + ")\n"
+    )
+
+
+def main() -> None:
+    OUTPUT.write_text(render())
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
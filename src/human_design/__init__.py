@@ -9,31 +9,56 @@ Core workflow:
 3. Convert to BodyGraphSummary64Keys via the API for full content
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # API imports temporarily disabled - API refactor in progress
 # from .api import GateAPI, bodygraph_to_summary, get_gate, get_gates, get_home_page
-from .models import (
-    ActivationSummary64Keys,
-    # Raw calculation models
-    BirthInfo,
-    BodyGraphDefinition,
-    BodyGraphSummary64Keys,
-    CenterDefinition,
-    CenterName,
-    GateDefinition,
-    GateLineNumber,
-    GateLineSummary64Keys,
-    GateNumber,
-    # 64keys summary models
-    GateSummary64Keys,
-    # Core types
-    Planet,
-    RawActivation,
-    RawBodyGraph,
-    ZodiacSign,
-)
+if TYPE_CHECKING:
+    from .models import (
+        ActivationSummary64Keys,
+        # Raw calculation models
+        BirthInfo,
+        BodyGraphDefinition,
+        BodyGraphSummary64Keys,
+        CenterDefinition,
+        CenterName,
+        GateDefinition,
+        GateLineNumber,
+        GateLineSummary64Keys,
+        GateNumber,
+        # 64keys summary models
+        GateSummary64Keys,
+        # Core types
+        Planet,
+        RawActivation,
+        RawBodyGraph,
+        ZodiacSign,
+    )
 
 __version__ = "0.1.0"
 
+# Names re-exported lazily from human_design.models (see __getattr__ below)
+_MODEL_EXPORTS = frozenset(
+    {
+        "ActivationSummary64Keys",
+        "BirthInfo",
+        "BodyGraphDefinition",
+        "BodyGraphSummary64Keys",
+        "CenterDefinition",
+        "CenterName",
+        "GateDefinition",
+        "GateLineNumber",
+        "GateLineSummary64Keys",
+        "GateNumber",
+        "GateSummary64Keys",
+        "Planet",
+        "RawActivation",
+        "RawBodyGraph",
+        "ZodiacSign",
+    }
+)
+
 __all__ = [
     # Core types
     "Planet",
@@ -60,3 +85,12 @@ __all__ = [
     "bodygraph_to_summary",
     "get_home_page",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Load models from human_design.models on first access, keeping `import human_design` cheap."""
+    if name in _MODEL_EXPORTS:
+        value = getattr(importlib.import_module(".models", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
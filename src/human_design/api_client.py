@@ -11,27 +11,121 @@ Key functionality:
 - Convert a RawBodyGraph to a BodyGraphSummary64Keys
 """
 
+import atexit
 import json
 import os
-from functools import lru_cache
+import re
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-import boto3
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .models import (
     ActivationSummary64Keys,
     BodyGraphDefinition,
     BodyGraphSummary64Keys,
-    GateLineSummary64Keys,
     GateNumber,
     GateSummary64Keys,
     RawActivation,
     RawBodyGraph,
 )
 
+try:
+    import lxml  # noqa: F401
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Maximum number of concurrent gate fetches against 64keys.com
+MAX_FETCH_WORKERS = 8
+
+# How long a validated session is trusted before checking it again
+AUTH_TTL_SECONDS = 300
+
+# Keep-alive connections held open to 64keys.com; at least MAX_FETCH_WORKERS
+# so concurrent fetches never fall back to fresh TLS handshakes
+HTTP_POOL_SIZE = 16
+
+# lxml's C parser is much faster than the pure-Python stdlib one
+HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+
+# Only the gate container is needed from a library API response
+_GATE_CONTAINER = SoupStrainer("div", id="aspectscontainer")
+_GATE_CLASSES = [
+    "gatenumber",
+    "gatesubline",
+    "qinfo",
+    "gatetext",
+    "potentialgatetext",
+    "potentialgateheadline",
+]
+
+# Line headlines look like "11.1": gate number, then the line number (1-6)
+_LINE_RE = re.compile(r"^\d+\.([1-6])\b")
+
+# Bump when GateSummary64Keys changes shape so stale gate caches are ignored
+GATE_CACHE_SCHEMA_VERSION = 1
+GATE_CACHE_KEY = "gate-cache.json"
+
+# Read size when streaming a page to disk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Persistent gate caches older than this are refetched
+DEFAULT_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600.0
+
+# Gates fetched one at a time are buffered before the gate cache is rewritten
+GATE_FLUSH_EVERY = 16
+_cache_max_age = DEFAULT_CACHE_MAX_AGE_SECONDS
+
+
+def _loads(data: str | bytes) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _s3_client() -> Any:
+    """Return a shared S3 client (boto3 clients are thread-safe)."""
+    import boto3
+
+    return boto3.client("s3")
+
+
+@lru_cache(maxsize=1)
+def _secrets_client() -> Any:
+    """Return a shared Secrets Manager client."""
+    import boto3
+
+    return boto3.client("secretsmanager")
+
 
 @lru_cache(maxsize=1)
 def _get_credentials() -> tuple[str, str]:
@@ -52,11 +146,8 @@ def _get_credentials() -> tuple[str, str]:
 
     if secret_name:
         try:
-            import boto3
-
-            client = boto3.client("secretsmanager")
-            response = client.get_secret_value(SecretId=secret_name)
-            secrets = json.loads(response["SecretString"])
+            response = _secrets_client().get_secret_value(SecretId=secret_name)
+            secrets = _loads(response["SecretString"])
             return secrets["HD_USERNAME"], secrets["HD_PASSWORD"]
         except Exception as e:
             print(f"Warning: Failed to fetch from Secrets Manager: {e}")
@@ -87,9 +178,8 @@ def _load_cached_cookies() -> dict[str, str] | None:
     # Try S3 first if bucket is configured
     if data_bucket:
         try:
-            s3 = boto3.client("s3")
-            response = s3.get_object(Bucket=data_bucket, Key="session-cache.json")
-            return json.loads(response["Body"].read())  # type: ignore
+            response = _s3_client().get_object(Bucket=data_bucket, Key="session-cache.json")
+            return _loads(response["Body"].read())  # type: ignore
         except Exception:
             pass  # Fall through to local disk cache
 
@@ -98,9 +188,9 @@ def _load_cached_cookies() -> dict[str, str] | None:
     cache_path = config_dir / "session.json"
     if cache_path.exists():
         try:
-            with open(cache_path) as f:
-                return json.load(f)  # type: ignore
-        except (json.JSONDecodeError, OSError):
+            with open(cache_path, "rb") as f:
+                return _loads(f.read())  # type: ignore
+        except (ValueError, OSError):
             return None
     return None
 
@@ -113,11 +203,10 @@ def _save_cookies(cookies: Any) -> None:
     # Try S3 first if bucket is configured
     if data_bucket:
         try:
-            s3 = boto3.client("s3")
-            s3.put_object(
+            _s3_client().put_object(
                 Bucket=data_bucket,
                 Key="session-cache.json",
-                Body=json.dumps(cookies_dict),
+                Body=_dumps(cookies_dict),
                 ContentType="application/json",
             )
             return
@@ -128,12 +217,139 @@ def _save_cookies(cookies: Any) -> None:
     config_dir = Path.home() / ".config" / "human-design"
     try:
         config_dir.mkdir(parents=True, exist_ok=True)
-        with open(config_dir / "session.json", "w") as f:
-            json.dump(cookies_dict, f)
+        with open(config_dir / "session.json", "wb") as f:
+            f.write(_dumps(cookies_dict))
     except OSError:
         pass  # Silently fail if we can't save cookies
 
 
+@lru_cache(maxsize=1)
+def _bodygraph_def() -> BodyGraphDefinition:
+    """Load the static bodygraph definition once per process."""
+    return BodyGraphDefinition.load()
+
+
+def set_cache_max_age(seconds: float) -> None:
+    """
+    Set how old the persistent gate cache may be before refetching.
+
+    A value of 0 bypasses the cache (fresh results are still written back).
+    The shared API instance is reset so the next call reloads its gate cache.
+
+    Args:
+        seconds: Maximum cache age in seconds
+    """
+    global _cache_max_age, _api_instance
+    if _api_instance is not None:
+        _api_instance.flush_gate_cache()
+    _cache_max_age = seconds
+    _api_instance = None
+
+
+def _is_fresh(modified_at: float) -> bool:
+    """Return whether a cache written at the given epoch time is still usable."""
+    return time.time() - modified_at < _cache_max_age
+
+
+def _write_atomic(path: Path, data: bytes | BinaryIO) -> None:
+    """Replace a file atomically so a concurrent reader never sees a partial write."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if isinstance(data, bytes):
+                f.write(data)
+            else:
+                shutil.copyfileobj(data, f, STREAM_CHUNK_SIZE)
+        os.replace(tmp_name, path)
+    except OSError:
+        os.unlink(tmp_name)
+        raise
+
+
+def _gate_cache_path() -> Path:
+    """Return the local disk location of the parsed gate cache."""
+    return Path.home() / ".cache" / "human-design" / "gates.json"
+
+
+class _GateCacheFile(BaseModel):
+    """On-disk layout of the persistent gate cache."""
+
+    schema_version: int
+    gates: dict[int, GateSummary64Keys]
+
+
+def _load_cached_gates() -> dict[int, GateSummary64Keys]:
+    """
+    Load parsed gate summaries cached in S3 or on local disk.
+
+    Returns:
+        Dictionary mapping gate number to GateSummary64Keys; empty if there is
+        no cache, it is older than the cache max age, or it was written with a
+        different schema version
+    """
+    raw: bytes | None = None
+    data_bucket = os.environ.get("DATA_BUCKET")
+
+    # Try S3 first if bucket is configured
+    if data_bucket:
+        try:
+            response = _s3_client().get_object(Bucket=data_bucket, Key=GATE_CACHE_KEY)
+            if not _is_fresh(response["LastModified"].timestamp()):
+                return {}
+            raw = response["Body"].read()
+        except Exception:
+            pass  # Fall through to local disk cache
+
+    # Fall back to local disk cache for development
+    if raw is None:
+        cache_path = _gate_cache_path()
+        try:
+            if not _is_fresh(cache_path.stat().st_mtime):
+                return {}
+            raw = cache_path.read_bytes()
+        except OSError:
+            return {}
+
+    # Parse and validate every cached gate in a single pydantic-core pass
+    try:
+        cache = _GateCacheFile.model_validate_json(raw)
+    except ValueError:
+        return {}
+
+    if cache.schema_version != GATE_CACHE_SCHEMA_VERSION:
+        return {}
+    return cache.gates
+
+
+def _save_cached_gates(gates: dict[int, GateSummary64Keys]) -> None:
+    """Save parsed gate summaries to S3 or local disk."""
+    data_bucket = os.environ.get("DATA_BUCKET")
+    body = _GateCacheFile(
+        schema_version=GATE_CACHE_SCHEMA_VERSION,
+        gates=dict(sorted(gates.items())),
+    ).model_dump_json().encode("utf-8")
+
+    # Try S3 first if bucket is configured
+    if data_bucket:
+        try:
+            _s3_client().put_object(
+                Bucket=data_bucket,
+                Key=GATE_CACHE_KEY,
+                Body=body,
+                ContentType="application/json",
+            )
+            return
+        except Exception:
+            pass  # Fall through to local disk cache
+
+    # Fall back to local disk cache for development
+    try:
+        _write_atomic(_gate_cache_path(), body)
+    except OSError:
+        pass  # Silently fail if we can't save the gate cache
+
+
 class GateAPI:
     """
     Client for 64keys.com API with authentication and data validation.
@@ -157,16 +373,38 @@ class GateAPI:
     def __init__(self) -> None:
         """Initialize the API client."""
         self.is_authenticated = False
+        self._auth_checked_at = 0.0
+        self._auth_lock = threading.Lock()
         self.session = requests.Session()
 
-        # Cache for gate summaries to avoid redundant API calls
-        self._gate_cache: dict[int, GateSummary64Keys] = {}
+        # Reuse pooled connections and retry transient gateway errors on GETs
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+
+        # Gates fetched since the persistent gate cache was last written
+        self._gate_cache_pending = 0
+        self._gate_cache_lock = threading.Lock()
+        _gate_apis.add(self)
 
         # Try to load cached cookies
         cached_cookies = _load_cached_cookies()
         if cached_cookies:
             self.session.cookies.update(cached_cookies)
 
+    @cached_property
+    def _gate_cache(self) -> dict[int, GateSummary64Keys]:
+        """
+        Cache for gate summaries to avoid redundant API calls.
+
+        Seeded on first use from the persistent gate cache written by earlier
+        runs, so clients that only use the session never read it.
+        """
+        return _load_cached_gates()
+
     def authenticate(self) -> None:
         """
         Authenticate with 64keys.com.
@@ -179,7 +417,7 @@ class GateAPI:
 
         # Get login page to grab CSRF token
         login_page = self.session.get(self.LOGIN_URL)
-        soup = BeautifulSoup(login_page.text, "html.parser")
+        soup = BeautifulSoup(login_page.text, HTML_PARSER)
         csrf_token = soup.find("meta", {"name": "csrf-token"})["content"]  # type: ignore
 
         # Login with CSRF token
@@ -198,6 +436,7 @@ class GateAPI:
         # Save cookies for future use
         _save_cookies(self.session.cookies)
         self.is_authenticated = True
+        self._auth_checked_at = time.monotonic()
 
     def _is_session_valid(self) -> bool:
         """
@@ -217,11 +456,23 @@ class GateAPI:
             return False
 
     def _ensure_authenticated(self) -> None:
-        """Ensure the session is authenticated."""
-        if not self.is_authenticated:
+        """
+        Ensure the session is authenticated.
+
+        A session that was validated within the last AUTH_TTL_SECONDS is
+        trusted without another round-trip to 64keys.com.
+        """
+        with self._auth_lock:
+            if (
+                self.is_authenticated
+                and time.monotonic() - self._auth_checked_at < AUTH_TTL_SECONDS
+            ):
+                return
+
             # Check if cached session is still valid
             if self._is_session_valid():
                 self.is_authenticated = True
+                self._auth_checked_at = time.monotonic()
             else:
                 self.authenticate()
 
@@ -236,94 +487,89 @@ class GateAPI:
         Returns:
             Validated GateSummary64Keys model instance
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_GATE_CONTAINER)
         container = soup.find("div", {"id": "aspectscontainer"})
 
         if not container:
             raise ValueError("Could not find gate container in response")
 
-        # Extract basic info
-        gate_num_elem = container.find("div", {"class": "gatenumber"})  # type: ignore
-        name_elem = container.find("div", {"class": "gatesubline"})  # type: ignore
-        quarter_elem = container.find("div", {"class": "qinfo"})  # type: ignore
-        summary_elem = container.find("div", {"class": "gatetext"})  # type: ignore
-
-        if not all([gate_num_elem, name_elem, quarter_elem, summary_elem]):
+        # Walk the gate's divs once in document order. The first of each
+        # class gives the basic info; after that, a headline's content is the
+        # gatesubline (title) and gatetext (body) that follow it.
+        first: dict[str, str] = {}
+        description = ""
+        strive = ""
+        strive_pending = False
+        strive_done = False
+        line_number: int | None = None
+        title: str | None = None
+        lines: list[dict[str, Any]] = []
+
+        for elem in container.find_all("div", class_=_GATE_CLASSES):  # type: ignore
+            classes = elem.get("class") or []
+            text = elem.text.strip()
+            for cls in classes:
+                first.setdefault(cls, text)
+
+            if "potentialgatetext" in classes and not description:
+                description = text
+
+            if "potentialgateheadline" in classes:
+                if not strive_done and "Strive" in elem.text:
+                    strive_pending = strive_done = True
+                # Check if this is a line number (e.g., "11.1")
+                match = _LINE_RE.match(text)
+                line_number = int(match.group(1)) if match else None
+                title = None
+                continue
+
+            if "gatesubline" in classes and line_number is not None and title is None:
+                title = text
+            if "gatetext" in classes:
+                if strive_pending:
+                    strive = text
+                    strive_pending = False
+                if line_number is not None and title is not None:
+                    lines.append({"line_number": line_number, "title": title, "text": text})
+                    line_number = None
+
+        if not all(cls in first for cls in ("gatenumber", "gatesubline", "qinfo", "gatetext")):
             raise ValueError("Missing required gate information in response")
 
-        gate_number = int(gate_num_elem.text.strip().replace("Gate ", ""))  # type: ignore
-        name = name_elem.text.strip()  # type: ignore
-        quarter = quarter_elem.text.strip().replace("Quarter: ", "")  # type: ignore
-        summary = summary_elem.text.strip()  # type: ignore
-
-        # Extract description
-        description_elems = container.find_all("div", {"class": "potentialgatetext"})  # type: ignore
-        description = description_elems[0].text.strip() if description_elems else ""
-
-        # Extract strive
-        strive_headline_tags = container.find_all(  # type: ignore
-            "div", {"class": "potentialgateheadline"}
-        )
-        strive = ""
-        for tag in strive_headline_tags:
-            if "Strive" in tag.text:
-                strive_text = tag.find_next("div", {"class": "gatetext"})
-                strive = strive_text.text.strip() if strive_text else ""
-                break
-
-        # Extract lines
-        lines = []
-        line_headlines = container.find_all("div", {"class": "potentialgateheadline"})  # type: ignore
-
-        for headline in line_headlines:
-            line_text = headline.text.strip()
-            # Check if this is a line number (e.g., "11.1")
-            if "." in line_text and line_text[0].isdigit():
-                try:
-                    # Extract the fractional part as line number (1-6)
-                    line_number_str = line_text.strip().split(".")[1]
-                    line_number = int(line_number_str)
-                    if not 1 <= line_number <= 6:
-                        continue
-
-                    # Get title (next gatesubline)
-                    title_elem = headline.find_next("div", {"class": "gatesubline"})
-                    title = title_elem.text.strip() if title_elem else ""
-
-                    # Get text (next gatetext)
-                    text_elem = title_elem.find_next("div", {"class": "gatetext"})
-                    text = text_elem.text.strip() if text_elem else ""
-
-                    lines.append(
-                        GateLineSummary64Keys(line_number=line_number, title=title, text=text)  # type: ignore
-                    )
-                except (ValueError, AttributeError, IndexError):
-                    continue
+        gate_number = int(first["gatenumber"].replace("Gate ", ""))
+        name = first["gatesubline"]
+        quarter = first["qinfo"].replace("Quarter: ", "")
+        summary = first["gatetext"]
 
         # Get gate definition from bodygraph for coordinate_range and bridge
-        bodygraph_def = BodyGraphDefinition.load()
+        bodygraph_def = _bodygraph_def()
         gate_def_from_bodygraph = bodygraph_def.get_gate(gate_number)
 
         if gate_def_from_bodygraph is None:
             raise ValueError(f"Gate {gate_number} not found in bodygraph definition")
 
-        return GateSummary64Keys(
-            number=gate_number,  # type: ignore
-            complement=gate_def_from_bodygraph.complement,
-            coordinate_range=gate_def_from_bodygraph.coordinate_range,
-            quarter=quarter,
-            name=name,
-            summary=summary,
-            description=description,
-            strive=strive,
-            lines=lines,
+        # Validate the scraped fields in one pass rather than through kwargs
+        return GateSummary64Keys.model_validate(
+            {
+                "number": gate_number,
+                "complement": gate_def_from_bodygraph.complement,
+                "coordinate_range": gate_def_from_bodygraph.coordinate_range,
+                "quarter": quarter,
+                "name": name,
+                "summary": summary,
+                "description": description,
+                "strive": strive,
+                "lines": lines,
+            }
         )
 
     def get_gate_summary(self, gate_number: int) -> GateSummary64Keys:
         """
         Fetch a Gate definition and return validated Gate model.
 
-        Uses caching to avoid redundant API calls for the same gate.
+        Uses caching to avoid redundant API calls for the same gate. Newly
+        fetched gates are written to the persistent gate cache in batches
+        (see flush_gate_cache).
 
         Args:
             gate_number: Gate number (1-64)
@@ -343,11 +589,31 @@ class GateAPI:
             return self._gate_cache[gate_number]
 
         self._ensure_authenticated()
+        gate = self._fetch_gate_summary(gate_number)
+        if self._gate_cache_pending >= GATE_FLUSH_EVERY:
+            self.flush_gate_cache()
 
-        response = self.session.get(
-            self.LIBRARY_API_URL,
-            params={"type": "gate", "param1": str(gate_number)},
-        )
+        return gate
+
+    def _fetch_gate_summary(self, gate_number: int) -> GateSummary64Keys:
+        """
+        Fetch and parse a Gate from the library API, adding it to the cache.
+
+        Assumes the session is already authenticated and does not write the
+        persistent gate cache; callers do that once their fetches are done.
+        """
+        params = {"type": "gate", "param1": str(gate_number)}
+        checked_at = self._auth_checked_at
+        response = self.session.get(self.LIBRARY_API_URL, params=params)
+
+        # The session expired server-side; log in again and retry once
+        if response.status_code in (401, 403):
+            with self._auth_lock:
+                # Another worker may already have logged in again
+                if self._auth_checked_at == checked_at:
+                    self.is_authenticated = False
+            self._ensure_authenticated()
+            response = self.session.get(self.LIBRARY_API_URL, params=params)
 
         if response.status_code != 200:
             raise requests.RequestException(
@@ -357,10 +623,69 @@ class GateAPI:
         gate = self._parse_gate_html(response.text)
 
         # Cache the result
-        self._gate_cache[gate_number] = gate
+        with self._gate_cache_lock:
+            self._gate_cache[gate_number] = gate
+            self._gate_cache_pending += 1
 
         return gate
 
+    def flush_gate_cache(self) -> None:
+        """
+        Write newly fetched gates to the persistent gate cache.
+
+        Runs after each get_gate_summaries batch, after every GATE_FLUSH_EVERY
+        single-gate fetches, and at interpreter exit. Does nothing when no gate
+        was fetched since the last write.
+        """
+        with self._gate_cache_lock:
+            if not self._gate_cache_pending:
+                return
+            self._gate_cache_pending = 0
+            _save_cached_gates(dict(self._gate_cache))
+
+    def get_gate_summaries(
+        self, gate_numbers: list[int], max_workers: int = MAX_FETCH_WORKERS
+    ) -> dict[int, GateSummary64Keys]:
+        """
+        Fetch several Gate definitions, overlapping the network requests.
+
+        Cached gates are returned directly; the remaining gates are fetched
+        concurrently on a thread pool sharing the authenticated session, and
+        the persistent gate cache is written once afterwards.
+
+        Args:
+            gate_numbers: Gate numbers (1-64)
+            max_workers: Maximum number of concurrent fetches
+
+        Returns:
+            Dictionary mapping gate number to GateSummary64Keys
+
+        Raises:
+            ValueError: If any gate_number is invalid
+            requests.RequestException: If any API request fails
+        """
+        unique = list(dict.fromkeys(gate_numbers))
+        missing = [n for n in unique if n not in self._gate_cache]
+        for gate_number in missing:
+            if not 1 <= gate_number <= 64:
+                raise ValueError(f"Gate number must be between 1 and 64, got {gate_number}")
+
+        fetched: dict[int, GateSummary64Keys] = {}
+        if len(missing) == 1:
+            fetched[missing[0]] = self.get_gate_summary(missing[0])
+        elif missing:
+            # Authenticate once up front so the workers don't race to log in
+            self._ensure_authenticated()
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+                futures = {pool.submit(self._fetch_gate_summary, n): n for n in missing}
+                for future in as_completed(futures):
+                    fetched[futures[future]] = future.result()
+
+            self.flush_gate_cache()
+
+        return {n: fetched[n] if n in fetched else self._gate_cache[n] for n in unique}
+
     def activation_to_summary(self, raw: RawActivation) -> ActivationSummary64Keys:
         """
         Convert a RawActivation to an ActivationSummary64Keys.
@@ -398,9 +723,7 @@ class GateAPI:
         """
         # Get all unique gates and fetch their summaries
         all_gate_numbers = list(raw_bodygraph.all_activated_gates)
-        gate_summaries: dict[int, GateSummary64Keys] = {}
-        for gate_num in all_gate_numbers:
-            gate_summaries[gate_num] = self.get_gate_summary(gate_num)
+        gate_summaries = self.get_gate_summaries(all_gate_numbers)
 
         # Convert conscious activations
         conscious_summaries: list[ActivationSummary64Keys] = []
@@ -426,6 +749,9 @@ class GateAPI:
         """
         Fetch the 64keys homepage.
 
+        The page is fetched behind the login and may be personalized, so it is
+        never cached.
+
         Returns:
             HTML content of the homepage
 
@@ -443,6 +769,46 @@ class GateAPI:
 
         return response.text
 
+    def save_home_page(self, path: Path) -> None:
+        """
+        Save the 64keys homepage to a file without holding it in memory.
+
+        The page is streamed to the file in chunks. Like get_home_page, it is
+        never cached.
+
+        Args:
+            path: File to write the homepage to
+
+        Raises:
+            requests.RequestException: If request fails
+        """
+        self._ensure_authenticated()
+
+        with self.session.get(self.HOME_URL, stream=True) as response:
+            if response.status_code != 200:
+                raise requests.RequestException(
+                    f"Failed to fetch homepage (Status: {response.status_code})"
+                )
+            response.raw.decode_content = True  # Undo any gzip transfer encoding
+            with open(path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, STREAM_CHUNK_SIZE)
+
+
+# Clients with gates that may still need writing to the persistent gate cache
+_gate_apis: weakref.WeakSet[GateAPI] = weakref.WeakSet()
+
+
+def _flush_gate_caches() -> None:
+    """Write every live client's pending gates; best-effort at interpreter exit."""
+    for api in list(_gate_apis):
+        try:
+            api.flush_gate_cache()
+        except Exception:
+            pass
+
+
+atexit.register(_flush_gate_caches)
+
 
 # Convenience functions for quick access
 _api_instance: GateAPI | None = None
@@ -469,21 +835,20 @@ def get_gate(gate_number: int) -> GateSummary64Keys:
     return _get_api().get_gate_summary(gate_number)
 
 
-def get_gates(gate_numbers: list[GateNumber]) -> dict[int, GateSummary64Keys]:
+def get_gates(
+    gate_numbers: list[GateNumber], max_workers: int = MAX_FETCH_WORKERS
+) -> dict[int, GateSummary64Keys]:
     """
     Convenience function to fetch multiple Gates.
 
     Args:
         gate_numbers: List of gate numbers (1-64)
+        max_workers: Maximum number of concurrent fetches
 
     Returns:
         Dictionary mapping gate number to GateSummary64Keys
     """
-    api = _get_api()
-    result: dict[int, GateSummary64Keys] = {}
-    for gate_num in gate_numbers:
-        result[gate_num] = api.get_gate_summary(gate_num)
-    return result
+    return _get_api().get_gate_summaries(list(gate_numbers), max_workers=max_workers)
 
 
 def bodygraph_to_summary(raw_bodygraph: RawBodyGraph) -> BodyGraphSummary64Keys:
@@ -507,3 +872,13 @@ def get_home_page() -> str:
         HTML content of the homepage
     """
     return _get_api().get_home_page()
+
+
+def save_home_page(path: Path) -> None:
+    """
+    Convenience function to save the homepage to a file.
+
+    Args:
+        path: File to write the homepage to
+    """
+    _get_api().save_home_page(path)
@@ -4,20 +4,47 @@ Utility functions for Human Design chart calculations.
 This module contains low-level utilities that are used by the models:
 - calc_lon_ut: Calculate planetary longitude and speed at a Julian Day
 - geocode_place: Convert place names to coordinates with caching
+- flush_geocode_cache: Write buffered geocode results to disk
+- get_timezone_finder: Shared TimezoneFinder instance for the process
 """
 
+from __future__ import annotations
+
+import atexit
+import functools
 import json
 import os
+import tempfile
+import threading
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import swisseph as swe  # type: ignore
 
+if TYPE_CHECKING:
+    from timezonefinder import TimezoneFinder
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# New geocode results buffered per cache file before it is rewritten
+GEOCODE_FLUSH_EVERY = 16
+
+_geocode_lock = threading.Lock()
+_geocode_pending: dict[str, int] = {}
+
 
 def calc_lon_ut(jd_ut: float, body: int) -> tuple[float, float]:
     """
     Calculate the ecliptic longitude and speed of a celestial body.
 
+    Results are memoized per process on (jd_ut rounded to 1e-8 days, body);
+    that quantum is under a millisecond, far below any chart's precision.
+
     Args:
         jd_ut: Julian Day in Universal Time
         body: Swiss Ephemeris body constant (e.g., swe.SUN, swe.MOON)
@@ -25,6 +52,17 @@ def calc_lon_ut(jd_ut: float, body: int) -> tuple[float, float]:
     Returns:
         Tuple of (longitude in degrees [0, 360), speed in degrees/day)
     """
+    return _calc_lon_ut_cached(round(jd_ut, 8), body)
+
+
+@functools.lru_cache(maxsize=4096)
+def _calc_lon_ut_cached(jd_ut: float, body: int) -> tuple[float, float]:
+    """
+    Memoized Swiss Ephemeris lookup behind calc_lon_ut.
+
+    The cache is process-local; call ``_calc_lon_ut_cached.cache_clear()`` if
+    the ephemeris files or path are changed at runtime.
+    """
     flags = swe.FLG_SWIEPH | swe.FLG_SPEED
     (xx, _retflag) = swe.calc_ut(jd_ut, body, flags)
     lon = float(xx[0]) % 360.0
@@ -32,12 +70,79 @@ def calc_lon_ut(jd_ut: float, body: int) -> tuple[float, float]:
     return lon, speed
 
 
+def _load_cache(cache_path: str) -> dict[str, Any]:
+    """Read the geocode JSON cache, using orjson when it is installed."""
+    with open(cache_path, "rb") as f:
+        data = f.read()
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_cache(cache: dict[str, Any], cache_path: str) -> None:
+    """Write the geocode JSON cache, using orjson when it is installed."""
+    if HAS_ORJSON:
+        data = orjson.dumps(cache, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(cache, indent=2, sort_keys=True).encode("utf-8")
+    # Replace the file atomically so a concurrent reader never sees a partial write
+    fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        os.unlink(tmp_name)
+        raise
+
+
+@functools.cache
+def _geocode_cache(cache_path: str) -> dict[str, Any]:
+    """Load a geocode cache file once; later lookups share the returned dict."""
+    if os.path.exists(cache_path):
+        try:
+            return _load_cache(cache_path)
+        except Exception:
+            pass
+    return {}
+
+
+def flush_geocode_cache() -> None:
+    """
+    Write buffered geocode results to their cache files.
+
+    Runs automatically at interpreter exit and after every GEOCODE_FLUSH_EVERY
+    new results. Entries written to the file by other processes since it was
+    loaded are merged in rather than overwritten. Writing is best-effort: a
+    cache file that cannot be written is skipped.
+    """
+    with _geocode_lock:
+        for cache_path in list(_geocode_pending):
+            del _geocode_pending[cache_path]
+            cache = _geocode_cache(cache_path)
+            try:
+                on_disk = _load_cache(cache_path)
+            except Exception:
+                on_disk = {}
+            # Keep this process's results for places both have looked up
+            cache.update({k: v for k, v in on_disk.items() if k not in cache})
+            try:
+                _dump_cache(cache, cache_path)
+            except OSError:
+                pass
+
+
+atexit.register(flush_geocode_cache)
+
+
 def geocode_place(place: str, cache_path: str = ".geocode_cache.json") -> tuple[float, float]:
     """
     Geocode a human-readable place string to (lat, lon).
 
     Uses a simple JSON cache to avoid repeated API calls. Falls back to ArcGIS
-    geocoder (free, no API key required) if not cached.
+    geocoder (free, no API key required) if not cached. The cache file is read
+    once per process; new results are buffered and written back in batches
+    (see flush_geocode_cache).
 
     Args:
         place: Location string (e.g., "New York, USA" or "Albuquerque, United States")
@@ -51,14 +156,7 @@ def geocode_place(place: str, cache_path: str = ".geocode_cache.json") -> tuple[
     """
     from geopy.geocoders import ArcGIS  # type: ignore
 
-    cache: dict[str, Any] = {}
-    if os.path.exists(cache_path):
-        try:
-            with open(cache_path, encoding="utf-8") as f:
-                cache = json.load(f)
-        except Exception:
-            cache = {}
-
+    cache = _geocode_cache(cache_path)
     if place in cache:
         return float(cache[place]["lat"]), float(cache[place]["lon"])
 
@@ -72,7 +170,27 @@ def geocode_place(place: str, cache_path: str = ".geocode_cache.json") -> tuple[
         raise RuntimeError(f"Could not geocode place: {place!r}")
 
     lat, lon = float(loc.latitude), float(loc.longitude) # type: ignore
-    cache[place] = {"lat": lat, "lon": lon, "ts": time.time()}
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2, sort_keys=True)
+    with _geocode_lock:
+        cache[place] = {"lat": lat, "lon": lon, "ts": time.time()}
+        pending = _geocode_pending.get(cache_path, 0) + 1
+        _geocode_pending[cache_path] = pending
+    if pending >= GEOCODE_FLUSH_EVERY:
+        flush_geocode_cache()
     return lat, lon
+
+
+@functools.lru_cache(maxsize=1)
+def get_timezone_finder() -> TimezoneFinder:
+    """
+    Return the process-wide TimezoneFinder, creating it on first use.
+
+    Constructing a TimezoneFinder opens its polygon data files, so it is built
+    once and reused by every timezone lookup (and across warm Lambda
+    invocations) instead of per call.
+
+    Returns:
+        Shared TimezoneFinder instance.
+    """
+    from timezonefinder import TimezoneFinder
+
+    return TimezoneFinder()
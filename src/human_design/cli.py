@@ -5,22 +5,50 @@ A Typer-based command-line application for scraping Human Design gate informatio
 from 64keys.com with proper authentication.
 """
 
+import functools
+import hashlib
+import heapq
 import json
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
 
 import typer
+from pydantic import TypeAdapter
 
-try:
-    import boto3
-    from rich.console import Console
-    from rich.table import Table
+from .api_client import (
+    DEFAULT_CACHE_MAX_AGE_SECONDS,
+    HTTP_POOL_SIZE,
+    bodygraph_to_summary,
+    get_gate,
+    get_gates,
+    save_home_page,
+    set_cache_max_age,
+)
+from .models import BirthInfo, GateSummary64Keys, LocalTime, RawBodyGraph
 
-    AWS_AVAILABLE = True
-except ImportError:
-    AWS_AVAILABLE = False
+# Rich color for each AWS Batch job status; anything else is shown in blue
+_STATUS_COLORS = {"SUCCEEDED": "green", "FAILED": "red", "RUNNING": "yellow"}
+
+# Cost Explorer bills every request, so its answers are reused for a while
+CE_CACHE_TTL_SECONDS = 6 * 3600
+
+# Gate numbers accepted by show_gates
+_VALID_GATES = frozenset(range(1, 65))
+
+# A gate number or an inclusive range of gate numbers, e.g. "11" or "1-10"
+_GATE_TOKEN_RE = re.compile(r"(\d+)(?:-(\d+))?")
+
+
+@functools.cache
+def _gates_adapter() -> TypeAdapter[list[GateSummary64Keys]]:
+    """Serializer for a list of gates, built on first use rather than at import."""
+    return TypeAdapter(list[GateSummary64Keys])
 
-from .api import bodygraph_to_summary, get_gate, get_gates, get_home_page
-from .models import BirthInfo, LocalTime, RawBodyGraph
 
 app = typer.Typer(help="Scraper for 64keys.com Human Design data")
 
@@ -29,6 +57,21 @@ aws_app = typer.Typer(help="AWS infrastructure commands")
 app.add_typer(aws_app, name="aws")
 
 
+@app.callback()
+def main(
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore cached gates and refetch them"
+    ),
+    max_age_days: float = typer.Option(
+        DEFAULT_CACHE_MAX_AGE_SECONDS / 86400,
+        "--max-age-days",
+        help="Refetch cached gates older than this many days",
+    ),
+) -> None:
+    """Configure the on-disk 64keys cache shared by all commands."""
+    set_cache_max_age(0 if refresh else max_age_days * 86400)
+
+
 @app.command()
 def bodygraph(
     date: str = typer.Argument(help="Birth date in YYYY-MM-DD format (e.g., 1990-01-15)"),
@@ -46,16 +89,11 @@ def bodygraph(
         human-design bodygraph 2000-06-21 12:30 London UK
     """
     try:
-        # Parse time
-        time_parts = time.split(":")
-        if len(time_parts) != 2:
-            typer.echo(f"❌ Invalid time format: {time}. Use HH:MM", err=True)
-            raise typer.Exit(code=1)
-
-        hour, minute = int(time_parts[0]), int(time_parts[1])
-        local_dt = datetime(
-            int(date.split("-")[0]), int(date.split("-")[1]), int(date.split("-")[2]), hour, minute
-        )
+        # Parse date and time in one pass
+        try:
+            local_dt = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+        except ValueError as e:
+            raise ValueError(f"{date} {time}. Use YYYY-MM-DD and HH:MM") from e
 
         # Create birth info
         typer.echo(f"📊 Calculating bodygraph for {city}, {state} on {date} at {time}...", err=True)
@@ -89,6 +127,35 @@ def bodygraph(
         raise typer.Exit(code=1) from e
 
 
+def _render_gate(gate_data: GateSummary64Keys, line: float | None = None) -> list[str]:
+    """
+    Render a gate for display as a list of output lines.
+
+    Args:
+        gate_data: Gate to render
+        line: Optional line number to limit the lines section to
+
+    Returns:
+        Output lines, without the closing rule
+    """
+    output = [
+        "\n" + "=" * 60,
+        typer.style(f"Gate {gate_data.number}: {gate_data.name}", bold=True),
+        "=" * 60,
+        f"Quarter: {gate_data.quarter}",
+        f"\n📝 Summary:\n{gate_data.summary}\n",
+        f"💡 Description:\n{gate_data.description}\n",
+        f"🎯 Strive:\n{gate_data.strive}\n",
+        typer.style("Lines:", bold=True),
+        "-" * 60,
+    ]
+    for gate_line in gate_data.lines:
+        if line is None or gate_line.line_number == line:
+            output.append(f"  {gate_line.line_number} - {gate_line.title}")
+            output.append(f"    {gate_line.text}\n")
+    return output
+
+
 @app.command()
 def gate(
     gate_number: int = typer.Argument(help="Gate number (1-64)", min=1, max=64),
@@ -106,25 +173,10 @@ def gate(
         gate_data = get_gate(gate_number)
         typer.echo(" ✓", err=False)
 
-        # Display results
-        typer.echo("\n" + "=" * 60)
-        typer.secho(f"Gate {gate_data.number}: {gate_data.name}", bold=True)
-        typer.echo("=" * 60)
-        typer.echo(f"Quarter: {gate_data.quarter}")
-        typer.echo(f"\n📝 Summary:\n{gate_data.summary}\n")
-        typer.echo(f"💡 Description:\n{gate_data.description}\n")
-        typer.echo(f"🎯 Strive:\n{gate_data.strive}\n")
-
-        # Display lines
-        typer.secho("Lines:", bold=True)
-        typer.echo("-" * 60)
-
-        for gate_line in gate_data.lines:
-            if line is None or gate_line.line_number == line:
-                typer.echo(f"  {gate_line.line_number} - {gate_line.title}")
-                typer.echo(f"    {gate_line.text}\n")
-
-        typer.echo("=" * 60)
+        # Display results in a single write
+        output = _render_gate(gate_data, line)
+        output.append("=" * 60)
+        typer.echo("\n".join(output))
 
     except ValueError as e:
         typer.echo(f"\n❌ Invalid input: {e}", err=True)
@@ -135,21 +187,51 @@ def gate(
 
 
 @app.command()
-def cache_gates() -> None:
+def cache_gates(
+    workers: int = typer.Option(
+        HTTP_POOL_SIZE, "--workers", "-w", min=1, help="Concurrent gate fetches"
+    ),
+    output_format: str = typer.Option(
+        "json", "--format", "-f", help="Output format: json (gates.json) or msgpack (gates.msgpack)"
+    ),
+) -> None:
     """
     Cache all 64 Human Design gates locally.
+
+    Gates are fetched concurrently over one authenticated session. The msgpack
+    format is smaller and faster to load; read it back with
+    msgpack.unpackb(data, raw=False).
     """
+    output_format = output_format.lower()
+    if output_format not in ("json", "msgpack"):
+        typer.echo(f"❌ Unknown format: {output_format} (use json or msgpack)", err=True)
+        raise typer.Exit(code=1)
+    if output_format == "msgpack":
+        try:
+            import msgpack
+        except ImportError:
+            typer.echo(
+                "❌ Error: msgpack is required. Install with: pip install -e '.[speedups]'",
+                err=True,
+            )
+            raise typer.Exit(code=1) from None
+
     try:
         typer.echo("🔐 Authenticating...", err=False)
         gate_numbers: list[int] = list(range(1, 65))
         # TODO: fix typing
-        gates = get_gates(gate_numbers)  # type: ignore
+        gates = get_gates(gate_numbers, max_workers=workers)  # type: ignore
         typer.echo(" ✓", err=False)
 
-        export = [g.model_dump() for g in gates.values()]
         typer.echo("\n💾 Caching gates locally...", err=False)
-        with open("gates.json", "w") as f:
-            json.dump(export, f, indent=2)
+        if output_format == "msgpack":
+            export = _gates_adapter().dump_python(list(gates.values()), mode="json")
+            with open("gates.msgpack", "wb") as f:
+                f.write(msgpack.packb(export, use_bin_type=True))
+        else:
+            # Serialized straight from the models, without an intermediate list of dicts
+            with open("gates.json", "wb") as f:
+                f.write(_gates_adapter().dump_json(list(gates.values()), indent=2))
         typer.echo(" ✓")
 
         typer.echo("✅ All gates cached successfully!")
@@ -171,31 +253,23 @@ def show_gates(
         human-design gates "1-10"                # Get gates 1 through 10
     """
     try:
-        # Parse gate numbers
+        # Parse gate numbers and ranges (e.g., "11" or "1-10")
         parsed_gates: list[int] = []
 
         for part in gate_numbers.split():
-            if "-" in part:
-                # Handle range (e.g., "1-10")
-                try:
-                    start, end = part.split("-")
-                    start_num, end_num = int(start.strip()), int(end.strip())
-                    parsed_gates.extend(range(start_num, end_num + 1))
-                except ValueError as e:
-                    typer.echo(f"❌ Invalid range format: {part}", err=True)
-                    raise typer.Exit(code=1) from e
-            else:
-                try:
-                    parsed_gates.append(int(part))
-                except ValueError as e:
-                    typer.echo(f"❌ Invalid gate number: {part}", err=True)
-                    raise typer.Exit(code=1) from e
+            match = _GATE_TOKEN_RE.fullmatch(part)
+            if match is None:
+                kind = "range format" if "-" in part else "gate number"
+                typer.echo(f"❌ Invalid {kind}: {part}", err=True)
+                raise typer.Exit(code=1)
+            start, end = match.groups()
+            parsed_gates.extend(range(int(start), int(end or start) + 1))
 
         # Validate gate numbers
-        for gate_num in parsed_gates:
-            if not 1 <= gate_num <= 64:
-                typer.echo(f"❌ Gate number must be between 1 and 64, got {gate_num}", err=True)
-                raise typer.Exit(code=1)
+        bad_gate = next((g for g in parsed_gates if g not in _VALID_GATES), None)
+        if bad_gate is not None:
+            typer.echo(f"❌ Gate number must be between 1 and 64, got {bad_gate}", err=True)
+            raise typer.Exit(code=1)
 
         if not parsed_gates:
             typer.echo("❌ No valid gate numbers provided", err=True)
@@ -206,25 +280,12 @@ def show_gates(
         gates_data = get_gates(parsed_gates)  # type: ignore
         typer.echo(" ✓")
 
-        # Display results
+        # Display results in a single write
+        output: list[str] = []
         for gate_data in gates_data.values():
-            typer.echo("\n" + "=" * 60)
-            typer.secho(f"Gate {gate_data.number}: {gate_data.name}", bold=True)
-            typer.echo("=" * 60)
-            typer.echo(f"Quarter: {gate_data.quarter}")
-            typer.echo(f"\n📝 Summary:\n{gate_data.summary}\n")
-            typer.echo(f"💡 Description:\n{gate_data.description}\n")
-            typer.echo(f"🎯 Strive:\n{gate_data.strive}\n")
-
-            # Display lines
-            typer.secho("Lines:", bold=True)
-            typer.echo("-" * 60)
-
-            for gate_line in gate_data.lines:
-                typer.echo(f"  {gate_line.line_number} - {gate_line.title}")
-                typer.echo(f"    {gate_line.text}\n")
-
-        typer.echo("=" * 60)
+            output.extend(_render_gate(gate_data))
+        output.append("=" * 60)
+        typer.echo("\n".join(output))
 
     except ValueError as e:
         typer.echo(f"\n❌ Invalid input: {e}", err=True)
@@ -241,13 +302,8 @@ def home() -> None:
         typer.echo("🔐 Authenticating...", err=False)
         typer.echo(" ✓", err=False)
 
-        typer.echo("\n📖 Fetching homepage...", err=False)
-        html_content = get_home_page()
-        typer.echo(" ✓", err=False)
-
-        typer.echo("\n💾 Saving to home.html...", err=False)
-        with open("home.html", "w") as f:
-            f.write(html_content)
+        typer.echo("\n📖 Fetching homepage to home.html...", err=False)
+        save_home_page(Path("home.html"))
         typer.echo(" ✓")
 
         typer.echo("✅ Done! Saved to home.html")
@@ -274,9 +330,14 @@ def aws_jobs(
         hd aws jobs --status RUNNING          # Show only running jobs
         hd aws jobs --limit 50                # Show last 50 jobs
     """
-    if not AWS_AVAILABLE:
+    # Imported here so commands that never touch AWS don't pay for boto3 and rich
+    try:
+        import boto3
+        from rich.console import Console
+        from rich.table import Table
+    except ImportError:
         typer.echo("❌ Error: boto3 and rich are required. Install with: pip install -e '.[dev]'", err=True)
-        raise typer.Exit(code=1)
+        raise typer.Exit(code=1) from None
 
     try:
         console = Console()
@@ -288,26 +349,30 @@ def aws_jobs(
         else:
             statuses = [status.upper()]
 
-        # Fetch jobs
+        # Fetch jobs, one list_jobs request per status, all in flight at once
         console.print(f"🔍 Fetching jobs from queue: [cyan]{queue}[/cyan]...")
         all_jobs = []
 
-        for job_status in statuses:
+        def list_jobs(job_status: str) -> list[dict]:
             try:
                 response = batch.list_jobs(
                     jobQueue=queue, jobStatus=job_status, maxResults=min(limit, 100)
                 )
-                all_jobs.extend(response.get("jobSummaryList", []))
+                return response.get("jobSummaryList", [])
             except Exception as e:
                 console.print(f"[yellow]⚠ Could not fetch {job_status} jobs: {e}[/yellow]")
+                return []
+
+        with ThreadPoolExecutor(max_workers=len(statuses)) as pool:
+            for jobs in pool.map(list_jobs, statuses):
+                all_jobs.extend(jobs)
 
         if not all_jobs:
             console.print(f"[yellow]No jobs found in queue '{queue}'[/yellow]")
             return
 
-        # Sort by creation time (newest first)
-        all_jobs.sort(key=lambda x: x.get("createdAt", 0), reverse=True)
-        all_jobs = all_jobs[:limit]
+        # Keep the newest `limit` jobs across all statuses (newest first)
+        all_jobs = heapq.nlargest(limit, all_jobs, key=lambda x: x.get("createdAt", 0))
 
         # Create table
         table = Table(title=f"AWS Batch Jobs - {queue}", show_header=True, header_style="bold magenta")
@@ -316,32 +381,22 @@ def aws_jobs(
         table.add_column("Created", width=20)
         table.add_column("Duration", justify="right", width=12)
 
+        now_ms = time.time() * 1000
         for job in all_jobs:
             job_name = job["jobName"]
             job_status_display = job["status"]
 
             # Color code status
-            if job_status_display == "SUCCEEDED":
-                status_display = f"[green]{job_status_display}[/green]"
-            elif job_status_display == "FAILED":
-                status_display = f"[red]{job_status_display}[/red]"
-            elif job_status_display == "RUNNING":
-                status_display = f"[yellow]{job_status_display}[/yellow]"
-            else:
-                status_display = f"[blue]{job_status_display}[/blue]"
+            color = _STATUS_COLORS.get(job_status_display, "blue")
+            status_display = f"[{color}]{job_status_display}[/{color}]"
 
-            # Format timestamps
+            # Format timestamps (epoch milliseconds)
             created_at = datetime.fromtimestamp(job["createdAt"] / 1000)
             created_str = created_at.strftime("%Y-%m-%d %H:%M:%S")
 
-            # Calculate duration if available
+            # Calculate duration if available, straight from the millisecond stamps
             if "startedAt" in job:
-                started = datetime.fromtimestamp(job["startedAt"] / 1000)
-                if "stoppedAt" in job:
-                    stopped = datetime.fromtimestamp(job["stoppedAt"] / 1000)
-                    duration = stopped - started
-                else:
-                    duration = datetime.now() - started
+                duration = timedelta(milliseconds=job.get("stoppedAt", now_ms) - job["startedAt"])
                 duration_str = str(duration).split(".")[0]  # Remove microseconds
             else:
                 duration_str = "-"
@@ -351,10 +406,7 @@ def aws_jobs(
         console.print(table)
 
         # Summary stats
-        status_counts = {}
-        for job in all_jobs:
-            s = job["status"]
-            status_counts[s] = status_counts.get(s, 0) + 1
+        status_counts = Counter(job["status"] for job in all_jobs)
 
         console.print("\n[bold]Summary:[/bold]")
         for s, count in sorted(status_counts.items()):
@@ -365,10 +417,49 @@ def aws_jobs(
         raise typer.Exit(code=1) from e
 
 
+def _call_cost_explorer(ce: Any, method: str, refresh: bool, **request: Any) -> tuple[dict, bool]:
+    """
+    Call a Cost Explorer API method, reusing a recent answer cached on disk.
+
+    Responses are stored under ~/.cache/human-design/ce keyed by the method and
+    its request parameters, and reused for CE_CACHE_TTL_SECONDS.
+
+    Args:
+        ce: boto3 Cost Explorer client
+        method: Client method name (e.g., "get_cost_and_usage")
+        refresh: Ignore any cached answer and call the API
+        **request: Parameters for the API call
+
+    Returns:
+        Tuple of (response, whether it came from the cache)
+    """
+    key = hashlib.sha256(json.dumps([method, request], sort_keys=True).encode()).hexdigest()
+    cache_path = Path.home() / ".cache" / "human-design" / "ce" / f"{key[:32]}.json"
+
+    if not refresh:
+        try:
+            if time.time() - cache_path.stat().st_mtime < CE_CACHE_TTL_SECONDS:
+                return json.loads(cache_path.read_text()), True
+        except (OSError, ValueError):
+            pass  # No usable cached answer
+
+    response = getattr(ce, method)(**request)
+    response.pop("ResponseMetadata", None)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(response, default=str))
+    except OSError:
+        pass  # Silently fail if we can't save the answer
+    return response, False
+
+
 @aws_app.command("billing")
 def aws_billing(
     days: int = typer.Option(30, "--days", "-d", help="Number of days to show"),
     breakdown: bool = typer.Option(True, "--breakdown/--no-breakdown", help="Show service breakdown"),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore Cost Explorer answers cached in the last 6 hours"
+    ),
 ) -> None:
     """
     Show AWS billing and cost breakdown.
@@ -377,10 +468,16 @@ def aws_billing(
         hd aws billing                    # Show last 30 days
         hd aws billing --days 7           # Show last 7 days
         hd aws billing --no-breakdown     # Hide service breakdown
+        hd aws billing --refresh          # Bypass the 6-hour response cache
     """
-    if not AWS_AVAILABLE:
+    # Imported here so commands that never touch AWS don't pay for boto3 and rich
+    try:
+        import boto3
+        from rich.console import Console
+        from rich.table import Table
+    except ImportError:
         typer.echo("❌ Error: boto3 and rich are required. Install with: pip install -e '.[dev]'", err=True)
-        raise typer.Exit(code=1)
+        raise typer.Exit(code=1) from None
 
     try:
         console = Console()
@@ -393,11 +490,16 @@ def aws_billing(
         console.print(f"💰 Fetching billing data from [cyan]{start_date}[/cyan] to [cyan]{end_date}[/cyan]...")
 
         # Get total cost
-        response = ce.get_cost_and_usage(
+        response, from_cache = _call_cost_explorer(
+            ce,
+            "get_cost_and_usage",
+            refresh,
             TimePeriod={"Start": str(start_date), "End": str(end_date)},
             Granularity="MONTHLY",
             Metrics=["UnblendedCost"],
         )
+        if from_cache:
+            console.print("[dim](cached; use --refresh to refetch)[/dim]")
 
         total_cost = 0.0
         for result in response["ResultsByTime"]:
@@ -408,7 +510,10 @@ def aws_billing(
 
         # Get service breakdown if requested
         if breakdown:
-            response_by_service = ce.get_cost_and_usage(
+            response_by_service, _ = _call_cost_explorer(
+                ce,
+                "get_cost_and_usage",
+                refresh,
                 TimePeriod={"Start": str(start_date), "End": str(end_date)},
                 Granularity="MONTHLY",
                 Metrics=["UnblendedCost"],
@@ -438,9 +543,9 @@ def aws_billing(
                 table.add_column("Cost", justify="right", style="green", width=15)
                 table.add_column("% of Total", justify="right", width=12)
 
+                pct_scale = 100 / total_cost if total_cost > 0 else 0
                 for service, cost in sorted_services:
-                    pct = (cost / total_cost * 100) if total_cost > 0 else 0
-                    table.add_row(service, f"${cost:.2f}", f"{pct:.1f}%")
+                    table.add_row(service, f"${cost:.2f}", f"{cost * pct_scale:.1f}%")
 
                 console.print("\n")
                 console.print(table)
@@ -449,7 +554,10 @@ def aws_billing(
 
         # Show forecast if available
         try:
-            forecast_response = ce.get_cost_forecast(
+            forecast_response, _ = _call_cost_explorer(
+                ce,
+                "get_cost_forecast",
+                refresh,
                 TimePeriod={
                     "Start": str(end_date),
                     "End": str(end_date + timedelta(days=30)),
@@ -6,6 +6,19 @@ Uses 64keys naming conventions with Ra names stored alongside for dual-mode disp
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy: dicts become MappingProxyType views, lists become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 # Center name mapping between systems
 CENTER_NAMES_64KEYS = {
     "INSPIRATION": "Inspiration",
@@ -31,15 +44,12 @@ CENTER_NAMES_RA = {
     "INTUITION": "Spleen",
 }
 
-# All 64 gates with metadata for flash cards
-GATES: dict[int, dict] = {
+# All 64 gates with metadata for flash cards (channel fields are filled in from _CHANNELS)
+_GATES: dict[int, dict] = {
     1: {
         "name_64keys": "Originality",
         "name_ra": "The Creative",
         "center": "Identity",
-        "partner_gates": [8],
-        "channel_names": ["Inspiration"],
-        "circuits": ["Individual Knowing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 1 (Originality) is a painter alone in a studio, brush flying. "
@@ -51,9 +61,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Orientation",
         "name_ra": "The Receptive",
         "center": "Identity",
-        "partner_gates": [14],
-        "channel_names": ["The Beat"],
-        "circuits": ["Individual Knowing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 2 (Orientation) is a compass needle. Gate 14 (Capacity) is a drum. "
@@ -65,9 +72,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Mutation",
         "name_ra": "Difficulty at the Beginning",
         "center": "Life Force",
-        "partner_gates": [60],
-        "channel_names": ["Mutation"],
-        "circuits": ["Individual Centering"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 3 IS Mutation. Gate 60 (Realism) provides the limitation that makes "
@@ -78,9 +82,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Theses",
         "name_ra": "Youthful Folly",
         "center": "Mind",
-        "partner_gates": [63],
-        "channel_names": ["Logic"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 1,
         "memory_hook": (
             "A courtroom. The Verification officer (63) slams a giant rubber stamp "
@@ -91,9 +92,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Rhythm",
         "name_ra": "Waiting",
         "center": "Life Force",
-        "partner_gates": [15],
-        "channel_names": ["Rhythm"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 5 IS Rhythm. Gate 15 is Flexibility — the love of extremes, of all "
@@ -104,9 +102,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Diplomacy",
         "name_ra": "Conflict",
         "center": "Emotion",
-        "partner_gates": [59],
-        "channel_names": ["Mating"],
-        "circuits": ["Tribal Defense"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 6 (Diplomacy) is a door. Gate 59 (Intimacy) is someone knocking. "
@@ -118,9 +113,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Strategy",
         "name_ra": "The Army",
         "center": "Identity",
-        "partner_gates": [31],
-        "channel_names": ["The Alpha"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 2,
         "memory_hook": (
             "A wolf pack: Gate 7 (Strategy) knows WHERE to go. Gate 31 (Influence) "
@@ -131,9 +123,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Promotion",
         "name_ra": "Holding Together",
         "center": "Expression",
-        "partner_gates": [1],
-        "channel_names": ["Inspiration"],
-        "circuits": ["Individual Knowing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 8 (Promotion) champions ideas. Gate 1 (Originality) creates them. "
@@ -144,9 +133,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Focussing",
         "name_ra": "The Taming Power of the Small",
         "center": "Life Force",
-        "partner_gates": [52],
-        "channel_names": ["Concentration"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 1,
         "memory_hook": (
             "Focussing (9) meets Stillness (52). A laser beam hits a perfectly still pond. "
@@ -157,9 +143,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Authenticity",
         "name_ra": "Treading",
         "center": "Identity",
-        "partner_gates": [20, 34, 57],
-        "channel_names": ["Awakening", "Exploration", "Perfected Form"],
-        "circuits": ["Integration"],
         "difficulty": 2,
         "memory_hook": (
             "Integration mega-hub. 'Authentic Present Strength through Intuition.' "
@@ -170,9 +153,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Ideas",
         "name_ra": "Peace",
         "center": "Mind",
-        "partner_gates": [56],
-        "channel_names": ["Curiosity"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "A child with 11 on their jersey bursts with ideas, tugging at a campfire "
@@ -183,9 +163,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Appropriateness",
         "name_ra": "Standstill",
         "center": "Expression",
-        "partner_gates": [22],
-        "channel_names": ["Openness"],
-        "circuits": ["Individual Centering"],
         "difficulty": 3,
         "memory_hook": (
             "An actor (12, Appropriateness — knowing when to speak) walks onto a stage. "
@@ -197,9 +174,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Mindfulness",
         "name_ra": "Fellowship of Man",
         "center": "Identity",
-        "partner_gates": [33],
-        "channel_names": ["The Prodigal"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "A traveler returns home. Gate 13 (Mindfulness — the listener, keeper of secrets) "
@@ -211,9 +185,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Capacity",
         "name_ra": "Possession in Great Measure",
         "center": "Life Force",
-        "partner_gates": [2],
-        "channel_names": ["The Beat"],
-        "circuits": ["Individual Knowing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 14 (Capacity — resources, fuel, power to manifest) is a drum. "
@@ -225,9 +196,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Flexibility",
         "name_ra": "Modesty",
         "center": "Identity",
-        "partner_gates": [5],
-        "channel_names": ["Rhythm"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 15 (Flexibility — love of extremes, all of humanity's rhythms) meets "
@@ -238,9 +206,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Identification",
         "name_ra": "Enthusiasm",
         "center": "Expression",
-        "partner_gates": [48],
-        "channel_names": ["The Wave Length"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 3,
         "memory_hook": (
             "Two musicians. Gate 16 (Identification — the enthusiastic practicer) plays guitar. "
@@ -251,9 +216,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Opinions",
         "name_ra": "Following",
         "center": "Mind",
-        "partner_gates": [62],
-        "channel_names": ["Acceptance"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 2,
         "memory_hook": (
             "A debate stage. Gate 17 (Opinions) shouts from a bullhorn. "
@@ -265,9 +227,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Judgment",
         "name_ra": "Work on What Has Been Spoiled",
         "center": "Intuition",
-        "partner_gates": [58],
-        "channel_names": ["Judgment"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 18 IS Judgment. Gate 58 (Joyfulness) provides the vitality behind "
@@ -278,9 +237,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Needs",
         "name_ra": "Approach",
         "center": "Drive",
-        "partner_gates": [49],
-        "channel_names": ["Synthesis"],
-        "circuits": ["Tribal Defense"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 49 (Principles — the tribal judge) sits in robes. Gate 19 (Needs) is a crowd "
@@ -291,9 +247,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Presentness",
         "name_ra": "Contemplation",
         "center": "Expression",
-        "partner_gates": [10, 34, 57],
-        "channel_names": ["Awakening", "Charisma", "The Brain Wave"],
-        "circuits": ["Integration"],
         "difficulty": 2,
         "memory_hook": (
             "Integration mega-hub. Gate 20 connects to 10, 34, and 57. "
@@ -304,9 +257,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Authority",
         "name_ra": "Biting Through",
         "center": "Willpower",
-        "partner_gates": [45],
-        "channel_names": ["Money"],
-        "circuits": ["Tribal Ego"],
         "difficulty": 1,
         "memory_hook": (
             "'SHOW ME THE MONEY!' Gate 21 (Authority — will to control resources) is Jerry Maguire. "
@@ -317,9 +267,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Mood",
         "name_ra": "Grace",
         "center": "Emotion",
-        "partner_gates": [12],
-        "channel_names": ["Openness"],
-        "circuits": ["Individual Centering"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 22 (Mood — unpredictable emotional shifts) in the audience. "
@@ -331,9 +278,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Clarity",
         "name_ra": "Splitting Apart",
         "center": "Expression",
-        "partner_gates": [43],
-        "channel_names": ["Structuring"],
-        "circuits": ["Individual Knowing"],
         "difficulty": 3,
         "memory_hook": (
             "A lightning bolt (43, Insight) strikes a glass prism (23, Clarity), "
@@ -344,9 +288,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Introspection",
         "name_ra": "Return",
         "center": "Mind",
-        "partner_gates": [61],
-        "channel_names": ["Awareness"],
-        "circuits": ["Individual Knowing"],
         "difficulty": 3,
         "memory_hook": (
             "A lighthouse (61) beams into infinite darkness — exploring the unknown. "
@@ -358,9 +299,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Naturalness",
         "name_ra": "Innocence",
         "center": "Identity",
-        "partner_gates": [51],
-        "channel_names": ["Initiation"],
-        "circuits": ["Individual Centering"],
         "difficulty": 3,
         "memory_hook": (
             "A child (25, natural innocence) at the edge of a cliff. A thunderbolt (51, courage) "
@@ -372,9 +310,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Tactic",
         "name_ra": "The Taming Power of the Great",
         "center": "Willpower",
-        "partner_gates": [44],
-        "channel_names": ["Surrender"],
-        "circuits": ["Tribal Ego"],
         "difficulty": 3,
         "memory_hook": (
             "A poker player (26, Tactic) going all-in, face down, sliding cards to their "
@@ -386,9 +321,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Caring",
         "name_ra": "Nourishment",
         "center": "Life Force",
-        "partner_gates": [50],
-        "channel_names": ["Preservation"],
-        "circuits": ["Tribal Defense"],
         "difficulty": 2,
         "memory_hook": (
             "A parent (27, Caring) cooking a massive pot of soup. The family rulebook (50, Values) "
@@ -399,9 +331,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Risk",
         "name_ra": "Preponderance of the Great",
         "center": "Intuition",
-        "partner_gates": [38],
-        "channel_names": ["Struggle"],
-        "circuits": ["Individual Centering"],
         "difficulty": 2,
         "memory_hook": (
             "A cliff-diver (28, Risk) stands at the edge. Gate 38 (Tenacity) is the voice "
@@ -413,9 +342,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Commitment",
         "name_ra": "The Abysmal",
         "center": "Life Force",
-        "partner_gates": [46],
-        "channel_names": ["Discovery"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 29 (Commitment — saying YES) shakes hands with Gate 46 (Dedication — love of the body). "
@@ -426,9 +352,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Feelings",
         "name_ra": "The Clinging",
         "center": "Emotion",
-        "partner_gates": [41],
-        "channel_names": ["Recognition"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "A bonfire (30, Feelings — the fire of desire). A dreamer (41, Hope) lying in grass, "
@@ -439,9 +362,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Influence",
         "name_ra": "Influence",
         "center": "Expression",
-        "partner_gates": [7],
-        "channel_names": ["The Alpha"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 31 (Influence — democratic leadership, the voice people follow) meets "
@@ -452,9 +372,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Continuity",
         "name_ra": "Duration",
         "center": "Intuition",
-        "partner_gates": [54],
-        "channel_names": ["Transformation"],
-        "circuits": ["Tribal Defense"],
         "difficulty": 3,
         "memory_hook": (
             "A quality inspector (32, Continuity — will this endure?). An employee (54, Ambition) "
@@ -465,9 +382,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Prudence",
         "name_ra": "Retreat",
         "center": "Expression",
-        "partner_gates": [13],
-        "channel_names": ["The Prodigal"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 33 (Prudence — wisdom of retreat) is the prodigal traveler who returns home. "
@@ -479,9 +393,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Strength",
         "name_ra": "The Power of the Great",
         "center": "Life Force",
-        "partner_gates": [10, 20, 57],
-        "channel_names": ["Exploration", "Charisma", "Power"],
-        "circuits": ["Integration"],
         "difficulty": 2,
         "memory_hook": (
             "Integration mega-hub. 'Authentic Present Strength through Intuition.' "
@@ -492,9 +403,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Progress",
         "name_ra": "Progress",
         "center": "Expression",
-        "partner_gates": [36],
-        "channel_names": ["Transitoriness"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 3,
         "memory_hook": (
             "A bus labeled '35-36.' The driver (35, Progress) always moves forward. "
@@ -506,9 +414,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Compassion",
         "name_ra": "Darkening of the Light",
         "center": "Emotion",
-        "partner_gates": [35],
-        "channel_names": ["Transitoriness"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 36 (Compassion — emotional inexperience driving the need for new experiences) "
@@ -519,9 +424,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Loyalty",
         "name_ra": "The Family",
         "center": "Emotion",
-        "partner_gates": [40],
-        "channel_names": ["Community"],
-        "circuits": ["Tribal Ego"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 37 (Loyalty — warmth of the hearth) is a fireplace. "
@@ -533,9 +435,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Tenacity",
         "name_ra": "Opposition",
         "center": "Drive",
-        "partner_gates": [28],
-        "channel_names": ["Struggle"],
-        "circuits": ["Individual Centering"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 38 (Tenacity — stubbornness to keep fighting) says 'AGAIN' to the "
@@ -546,9 +445,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Liberation",
         "name_ra": "Obstruction",
         "center": "Drive",
-        "partner_gates": [55],
-        "channel_names": ["Emoting"],
-        "circuits": ["Individual Centering"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 39 (Liberation — the provocateur) walks into a room where Gate 55 (Abundance) "
@@ -560,9 +456,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Determination",
         "name_ra": "Deliverance",
         "center": "Willpower",
-        "partner_gates": [37],
-        "channel_names": ["Community"],
-        "circuits": ["Tribal Ego"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 40 (Determination — the will to work alone for the family's benefit) "
@@ -574,9 +467,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Hope",
         "name_ra": "Decrease",
         "center": "Drive",
-        "partner_gates": [30],
-        "channel_names": ["Recognition"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 41 (Hope — the daydream, imagining new possibilities) lies in grass watching clouds. "
@@ -588,9 +478,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Increase",
         "name_ra": "Increase",
         "center": "Life Force",
-        "partner_gates": [53],
-        "channel_names": ["Maturation"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 42 (Increase — growth, completion, fullness of a cycle) is a fruit tree heavy "
@@ -602,9 +489,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Insight",
         "name_ra": "Breakthrough",
         "center": "Mind",
-        "partner_gates": [23],
-        "channel_names": ["Structuring"],
-        "circuits": ["Individual Knowing"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 43 (Insight — sudden flash, the 'aha!') is a lightning bolt. "
@@ -616,9 +500,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Collaboration",
         "name_ra": "Coming to Meet",
         "center": "Intuition",
-        "partner_gates": [26],
-        "channel_names": ["Surrender"],
-        "circuits": ["Tribal Ego"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 44 (Collaboration — the nose for talent, pattern recognition). "
@@ -630,9 +511,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Accumulation",
         "name_ra": "Gathering Together",
         "center": "Expression",
-        "partner_gates": [21],
-        "channel_names": ["Money"],
-        "circuits": ["Tribal Ego"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 45 (Accumulation — gathering the tribe's wealth) is the king on the throne. "
@@ -643,9 +521,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Dedication",
         "name_ra": "Pushing Upward",
         "center": "Identity",
-        "partner_gates": [29],
-        "channel_names": ["Discovery"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 46 (Dedication — love of the body, being in the right place). "
@@ -657,9 +532,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Interpretation",
         "name_ra": "Oppression",
         "center": "Mind",
-        "partner_gates": [64],
-        "channel_names": ["Abstraction"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "A person in a lab coat (47) tries to interpret the kaleidoscopic patterns "
@@ -671,9 +543,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Depth",
         "name_ra": "The Well",
         "center": "Intuition",
-        "partner_gates": [16],
-        "channel_names": ["The Wave Length"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 48 (Depth — deep knowledge, the well of talent) plays cello. "
@@ -685,9 +554,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Principles",
         "name_ra": "Revolution",
         "center": "Emotion",
-        "partner_gates": [19],
-        "channel_names": ["Synthesis"],
-        "circuits": ["Tribal Defense"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 49 (Principles — the tribal judge) in robes. "
@@ -699,9 +565,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Values",
         "name_ra": "The Cauldron",
         "center": "Intuition",
-        "partner_gates": [27],
-        "channel_names": ["Preservation"],
-        "circuits": ["Tribal Defense"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 50 (Values — tribal laws, what's acceptable) is the family rulebook. "
@@ -713,9 +576,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Courage",
         "name_ra": "The Arousing",
         "center": "Willpower",
-        "partner_gates": [25],
-        "channel_names": ["Initiation"],
-        "circuits": ["Individual Centering"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 51 (Courage — competitive spirit, the jolt) is a thunderbolt striking "
@@ -727,9 +587,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Stillness",
         "name_ra": "Keeping Still",
         "center": "Drive",
-        "partner_gates": [9],
-        "channel_names": ["Concentration"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 52 (Stillness) is a perfectly still pond. Gate 9 (Focussing) is a laser beam. "
@@ -740,9 +597,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Readiness",
         "name_ra": "Development",
         "center": "Drive",
-        "partner_gates": [42],
-        "channel_names": ["Maturation"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 53 (Readiness — pressure to start something new) is a seed eager to sprout. "
@@ -754,9 +608,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Ambition",
         "name_ra": "The Marrying Maiden",
         "center": "Drive",
-        "partner_gates": [32],
-        "channel_names": ["Transformation"],
-        "circuits": ["Tribal Defense"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 54 (Ambition — drive to rise, transform social standing) is an employee "
@@ -768,9 +619,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Abundance",
         "name_ra": "Abundance",
         "center": "Emotion",
-        "partner_gates": [39],
-        "channel_names": ["Emoting"],
-        "circuits": ["Individual Centering"],
         "difficulty": 3,
         "memory_hook": (
             "Gate 55 (Abundance — melancholy spirit, ecstasy and emptiness) sits alone. "
@@ -782,9 +630,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Stimulation",
         "name_ra": "The Wanderer",
         "center": "Expression",
-        "partner_gates": [11],
-        "channel_names": ["Curiosity"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 56 (Stimulation — the storyteller by the campfire). "
@@ -796,9 +641,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Intuition",
         "name_ra": "The Gentle",
         "center": "Intuition",
-        "partner_gates": [10, 20, 34],
-        "channel_names": ["Perfected Form", "The Brain Wave", "Power"],
-        "circuits": ["Integration"],
         "difficulty": 2,
         "memory_hook": (
             "Integration mega-hub. Gate 57 connects to 10, 20, and 34. "
@@ -809,9 +651,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Joyfulness",
         "name_ra": "The Joyous",
         "center": "Drive",
-        "partner_gates": [18],
-        "channel_names": ["Judgment"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 58 (Joyfulness — vitality that fuels improvement). "
@@ -823,9 +662,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Intimacy",
         "name_ra": "Dispersion",
         "center": "Life Force",
-        "partner_gates": [6],
-        "channel_names": ["Mating"],
-        "circuits": ["Tribal Defense"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 59 (Intimacy — Sacral power to break through barriers). "
@@ -837,9 +673,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Realism",
         "name_ra": "Limitation",
         "center": "Drive",
-        "partner_gates": [3],
-        "channel_names": ["Mutation"],
-        "circuits": ["Individual Centering"],
         "difficulty": 1,
         "memory_hook": (
             "Gate 60 (Realism — limitation, constraints). Gate 3 IS Mutation. "
@@ -851,9 +684,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Exploration",
         "name_ra": "Inner Truth",
         "center": "Inspiration",
-        "partner_gates": [24],
-        "channel_names": ["Awareness"],
-        "circuits": ["Individual Knowing"],
         "difficulty": 3,
         "memory_hook": (
             "A lighthouse (61) beaming into infinite darkness — exploring the unknown. "
@@ -865,9 +695,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Precision",
         "name_ra": "Preponderance of the Small",
         "center": "Expression",
-        "partner_gates": [17],
-        "channel_names": ["Acceptance"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 2,
         "memory_hook": (
             "Gate 62 (Precision — the accountant with a ruler) demands facts. "
@@ -879,9 +706,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Verification",
         "name_ra": "After Completion",
         "center": "Inspiration",
-        "partner_gates": [4],
-        "channel_names": ["Logic"],
-        "circuits": ["Collective Understanding"],
         "difficulty": 1,
         "memory_hook": (
             "The Verification officer (63) stamps a PhD thesis (4). "
@@ -892,9 +716,6 @@ GATES: dict[int, dict] = {
         "name_64keys": "Reflection",
         "name_ra": "Before Completion",
         "center": "Inspiration",
-        "partner_gates": [47],
-        "channel_names": ["Abstraction"],
-        "circuits": ["Collective Sensing"],
         "difficulty": 2,
         "memory_hook": (
             "The number 64 as a massive Rubik's Cube reflecting light onto the walls. "
@@ -906,7 +727,7 @@ GATES: dict[int, dict] = {
 
 
 # All 36 channels with dual naming
-CHANNELS: dict[str, dict] = {
+_CHANNELS: dict[str, dict] = {
     "Abstraction": {
         "gates": [47, 64],
         "centers": ["Mind", "Inspiration"],
@@ -1241,8 +1062,35 @@ CHANNELS: dict[str, dict] = {
 }
 
 
+def _link_channels(gates: dict[int, dict], channels: dict[str, dict]) -> dict[int, dict]:
+    """
+    Add each gate's channel fields, derived from the channel table.
+
+    Every channel is stored once in the channel table; a gate's partner_gates, channel_names,
+    and circuits are read from the channels it belongs to, ordered by partner gate.
+    """
+    links: dict[int, list[tuple[int, str, str]]] = {number: [] for number in gates}
+    for name, channel in channels.items():
+        gate_a, gate_b = channel["gates"]
+        links[gate_a].append((gate_b, name, channel["circuit"]))
+        links[gate_b].append((gate_a, name, channel["circuit"]))
+
+    linked: dict[int, dict] = {}
+    for number, gate in gates.items():
+        gate_links = sorted(links[number])
+        record: dict[str, Any] = {}
+        for key, value in gate.items():
+            record[key] = value
+            if key == "center":
+                record["partner_gates"] = [partner for partner, _, _ in gate_links]
+                record["channel_names"] = [name for _, name, _ in gate_links]
+                record["circuits"] = list(dict.fromkeys(circuit for _, _, circuit in gate_links))
+        linked[number] = record
+    return linked
+
+
 # Gates that are easily confused with each other
-CONFUSABLE_CLUSTERS: dict[str, list[dict]] = {
+_CONFUSABLE_CLUSTERS: dict[str, list[dict]] = {
     "Deep Thinking Gates": [
         {"gate": 24, "name": "Introspection", "distinction": "Mental looping — the hamster wheel. Repetitive."},
         {"gate": 47, "name": "Interpretation", "distinction": "Translating confusion into meaning. Translating."},
@@ -1274,7 +1122,7 @@ CONFUSABLE_CLUSTERS: dict[str, list[dict]] = {
 
 
 # Circuit group metadata
-CIRCUIT_GROUPS: dict[str, dict] = {
+_CIRCUIT_GROUPS: dict[str, dict] = {
     "Individual": {
         "theme": "Mutation, uniqueness, empowerment",
         "keyword": "I know / I feel",
@@ -1321,3 +1169,56 @@ CIRCUIT_GROUPS: dict[str, dict] = {
         },
     },
 }
+
+
+def _validate_tables(
+    gates: dict[int, dict],
+    channels: dict[str, dict],
+    clusters: dict[str, list[dict]],
+    circuit_groups: dict[str, dict],
+) -> None:
+    """
+    Check the hand-edited tables agree with each other.
+
+    Runs once at import; partner gates are derived from the channel table, so this
+    covers what _link_channels cannot: a channel's centers and circuit, and the gate
+    names repeated in the confusable clusters.
+    """
+    if sorted(gates) != list(range(1, 65)):
+        raise ValueError("Gate table must cover gates 1-64 exactly once")
+
+    sub_circuits = {
+        name: sub_circuit
+        for group in circuit_groups.values()
+        for sub_circuit, names in group["sub_circuits"].items()
+        for name in names
+    }
+    if sub_circuits.keys() != channels.keys():
+        raise ValueError("Circuit groups must list every channel exactly once")
+
+    pairs: set[frozenset[int]] = set()
+    for name, channel in channels.items():
+        gate_a, gate_b = channel["gates"]
+        if frozenset((gate_a, gate_b)) in pairs:
+            raise ValueError(f"Channel {name} repeats gates {gate_a}-{gate_b}")
+        pairs.add(frozenset((gate_a, gate_b)))
+        if channel["centers"] != [gates[gate_a]["center"], gates[gate_b]["center"]]:
+            raise ValueError(f"Channel {name} centers do not match gates {gate_a}-{gate_b}")
+        listed = sub_circuits[name]
+        if listed != channel["circuit"]:
+            raise ValueError(f"Channel {name} is listed under {listed}, not {channel['circuit']}")
+
+    for cluster, entries in clusters.items():
+        for entry in entries:
+            if gates[entry["gate"]]["name_64keys"] != entry["name"]:
+                raise ValueError(f"{cluster}: gate {entry['gate']} is not {entry['name']}")
+
+
+if __debug__:
+    _validate_tables(_GATES, _CHANNELS, _CONFUSABLE_CLUSTERS, _CIRCUIT_GROUPS)
+
+# Shared read-only views; the web app serves these directly, so they must never be mutated
+GATES: Mapping[int, Mapping[str, Any]] = _freeze(_link_channels(_GATES, _CHANNELS))
+CHANNELS: Mapping[str, Mapping[str, Any]] = _freeze(_CHANNELS)
+CONFUSABLE_CLUSTERS: Mapping[str, tuple[Mapping[str, Any], ...]] = _freeze(_CONFUSABLE_CLUSTERS)
+CIRCUIT_GROUPS: Mapping[str, Mapping[str, Any]] = _freeze(_CIRCUIT_GROUPS)
@@ -23,42 +23,40 @@ Usage:
     )
 """
 
-# Core types
-# Raw bodygraph models
-from .bodygraph import (
-    BirthInfo,
-    BodyGraphDefinition,
-    CenterDefinition,
-    GateDefinition,
-    RawActivation,
-    RawBodyGraph,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Coordinate models
-from .coordinates import (
-    CoordinateRange,
-    GeographicalCoordinate,
-    LocalTime,
-    Location,
-    ZodiacCoordinate,
-)
-from .core import (
-    CenterName,
-    GateLineNumber,
-    GateNumber,
-    Planet,
-    ZodiacSign,
-    ZodiacSignField,
-)
-
-# 64keys summary models
-from .summaries_64keys import (
-    ActivationSummary64Keys,
-    BodyGraphSummary64Keys,
-    CenterSummary64Keys,
-    GateLineSummary64Keys,
-    GateSummary64Keys,
-)
+if TYPE_CHECKING:
+    from .bodygraph import (
+        BirthInfo,
+        BodyGraphDefinition,
+        CenterDefinition,
+        GateDefinition,
+        RawActivation,
+        RawBodyGraph,
+    )
+    from .coordinates import (
+        CoordinateRange,
+        GeographicalCoordinate,
+        LocalTime,
+        Location,
+        ZodiacCoordinate,
+    )
+    from .core import (
+        CenterName,
+        GateLineNumber,
+        GateNumber,
+        Planet,
+        ZodiacSign,
+        ZodiacSignField,
+    )
+    from .summaries_64keys import (
+        ActivationSummary64Keys,
+        BodyGraphSummary64Keys,
+        CenterSummary64Keys,
+        GateLineSummary64Keys,
+        GateSummary64Keys,
+    )
 
 __all__ = [
     # Core
@@ -88,3 +86,47 @@ __all__ = [
     "GateLineSummary64Keys",
     "GateSummary64Keys",
 ]
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so importing this package does not build
+# every model class up front.
+_LAZY_IMPORTS = {
+    "BirthInfo": "bodygraph",
+    "BodyGraphDefinition": "bodygraph",
+    "CenterDefinition": "bodygraph",
+    "GateDefinition": "bodygraph",
+    "RawActivation": "bodygraph",
+    "RawBodyGraph": "bodygraph",
+    "CoordinateRange": "coordinates",
+    "GeographicalCoordinate": "coordinates",
+    "LocalTime": "coordinates",
+    "Location": "coordinates",
+    "ZodiacCoordinate": "coordinates",
+    "CenterName": "core",
+    "GateLineNumber": "core",
+    "GateNumber": "core",
+    "Planet": "core",
+    "ZodiacSign": "core",
+    "ZodiacSignField": "core",
+    "ActivationSummary64Keys": "summaries_64keys",
+    "BodyGraphSummary64Keys": "summaries_64keys",
+    "CenterSummary64Keys": "summaries_64keys",
+    "GateLineSummary64Keys": "summaries_64keys",
+    "GateSummary64Keys": "summaries_64keys",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public model from its submodule on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public models alongside the attributes already loaded."""
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,8 @@ content like descriptions, summaries, or interpretations.
 The raw models can be converted to 64keys summary models via the API.
 """
 
+import bisect
+import functools
 import importlib.resources
 import math
 from collections.abc import Iterator
@@ -25,9 +27,8 @@ from pydantic import (
     computed_field,
     model_validator,
 )
-from timezonefinder import TimezoneFinder
 
-from ..calculate_utils import calc_lon_ut, geocode_place
+from ..calculate_utils import calc_lon_ut, geocode_place, get_timezone_finder
 from .channel import ChannelDefinition, ChannelRegistry
 from .coordinates import CoordinateRange, LocalTime
 from .core import CenterName, GateLineNumber, GateNumber, Planet, PlanetField
@@ -97,31 +98,39 @@ class BodyGraphDefinition(BaseModel):
             Tuple of (gate_number, line_number)
 
         Raises:
-            RuntimeError: If no gate range contains the longitude
+            RuntimeError: If the gate ranges do not tile the zodiac
         """
         # Normalize longitude to [0, 360)
         lon = lon % 360.0
 
-        for gate in self.all_gates:
-            s = gate.coordinate_range.start_deg
-            e = gate.coordinate_range.end_deg
-
-            if s <= e:
-                # Normal range (doesn't wrap around 360)
-                if s <= lon < e:
-                    span = e - s
-                    offset = lon - s
-                    line = int(math.floor(offset / (span / 6.0))) + 1
-                    return gate.number, cast(GateLineNumber, min(max(line, 1), 6))
-            else:
-                # Range wraps around 360 (e.g., 350-10 degrees)
-                if lon >= s or lon < e:
-                    span = (360.0 - s) + e
-                    offset = (lon - s) if lon >= s else ((360.0 - s) + lon)
-                    line = int(math.floor(offset / (span / 6.0))) + 1
-                    return gate.number, cast(GateLineNumber, min(max(line, 1), 6))
-
-        raise RuntimeError(f"No gate range found for longitude {lon}")
+        starts, ranges = self._longitude_index
+        # Longitudes before the first start fall in the gate that wraps past 360
+        # (index -1 is the last, highest-start range).
+        s, span, gate_number = ranges[bisect.bisect_right(starts, lon) - 1]
+        # The ranges tile the circle, so the bisected range always holds lon; just
+        # below a range's end, offset can round up to span, which the clamp absorbs
+        offset = (lon - s) if lon >= s else ((360.0 - s) + lon)
+        line = int(math.floor(offset / (span / 6.0))) + 1
+        return gate_number, cast(GateLineNumber, min(max(line, 1), 6))
+
+    @functools.cached_property
+    def _longitude_index(self) -> tuple[list[float], list[tuple[float, float, GateNumber]]]:
+        """Gate ranges as (start, span, gate) sorted by start, plus the starts for bisect."""
+        bounds = sorted(
+            (gate.coordinate_range.start_deg, gate.coordinate_range.end_deg, gate.number)
+            for gate in self.all_gates
+        )
+        ranges = []
+        for i, (s, e, gate_number) in enumerate(bounds):
+            next_start = bounds[(i + 1) % len(bounds)][0]
+            if e != next_start:
+                raise RuntimeError(
+                    f"Gate {gate_number} ends at {e}, but the next range starts at {next_start}"
+                )
+            # Ranges that wrap around 360 (e.g., 350-10 degrees) span the seam
+            span = (e - s) if s <= e else ((360.0 - s) + e)
+            ranges.append((s, span, gate_number))
+        return [s for s, _, _ in ranges], ranges
 
     @classmethod
     def load(cls) -> Self:
@@ -133,6 +142,12 @@ class BodyGraphDefinition(BaseModel):
         return cls.model_validate({"centers": raw})
 
 
+@functools.cache
+def _bodygraph_definition() -> BodyGraphDefinition:
+    """Load the bodygraph definition once per process; it only changes with bodygraph.yaml."""
+    return BodyGraphDefinition.load()
+
+
 class RawActivation(BaseModel):
     """
     A raw planetary activation (planet + gate + line).
@@ -161,6 +176,33 @@ class RawActivation(BaseModel):
         return f"{self.gate}.{self.line}"
 
 
+def _activations_at(jd_ut: float) -> list[RawActivation]:
+    """
+    Calculate one activation per planet at the given Julian Day UT.
+
+    Each ephemeris body is queried once; Earth and the South Node are the
+    points opposite the Sun and North Node. Planet iteration order puts SUN
+    before EARTH and TRUE_NODE before SOUTH_NODE, so both are already known.
+    """
+    definitions = _bodygraph_definition()
+    longitudes: dict[Planet, float] = {}
+    activations: list[RawActivation] = []
+
+    for planet in Planet:
+        if planet == Planet.EARTH:
+            lon = (longitudes[Planet.SUN] + 180.0) % 360.0
+        elif planet == Planet.SOUTH_NODE:
+            lon = (longitudes[Planet.NORTH_NODE] + 180.0) % 360.0
+        else:
+            lon = planet.lon_ut(jd_ut)
+        longitudes[planet] = lon
+
+        gate_num, line_num = definitions.gate_and_line_from_longitude(lon)
+        activations.append(RawActivation(planet=planet, gate=gate_num, line=line_num))
+
+    return activations
+
+
 def _assert_hyphenated_european_date(date_str: str) -> str:
     """Assert date string is in YYYY-MM-DD format."""
     try:
@@ -224,8 +266,7 @@ class BirthInfo(BaseModel):
     def timezone(self) -> str:
         """Timezone name for the birth location."""
         lat, lon = self.coordinates
-        tf = TimezoneFinder()
-        tz_name = tf.timezone_at(lat=lat, lng=lon)
+        tz_name = get_timezone_finder().timezone_at(lat=lat, lng=lon)
         if tz_name is None:
             raise RuntimeError(f"Could not determine timezone for coordinates: {lat}, {lon}")
         # Validate timezone
@@ -251,16 +292,23 @@ class BirthInfo(BaseModel):
         88 degrees earlier in the zodiac (not 88 days - the actual time varies
         based on the Sun's apparent speed throughout the year).
 
-        Uses Newton-Raphson root finding to converge on the exact moment.
+        Uses Newton-Raphson root finding with the Sun's apparent speed as the
+        derivative. The geocentric Sun never retrogrades (~0.95-1.02 deg/day),
+        so longitude is monotonic in time and Newton converges quadratically:
+        three ephemeris calls reach 1e-7 degrees (a few ms) from an 88-day
+        guess. Tighter tolerances stall on calc_lon_ut's 1e-8 day memo quantum.
         """
+        # birth_jd_ut resolves the timezone on every access; read it once
+        birth_jd_ut = self.birth_jd_ut
+
         # Get the Sun's ecliptic longitude at birth
-        birth_sun_lon = Planet.SUN.lon_ut(self.birth_jd_ut)
+        birth_sun_lon = Planet.SUN.lon_ut(birth_jd_ut)
 
         # Target longitude is 88° earlier (with wraparound)
         target = (birth_sun_lon - 88.0) % 360.0
 
         # Initial guess: approximately 88 days earlier
-        current = self.birth_jd_ut - 88.0
+        current = birth_jd_ut - 88.0
 
         def _angdiff_signed(a: float, b: float) -> float:
             """Compute smallest signed angular difference (a - b) in degrees."""
@@ -268,14 +316,16 @@ class BirthInfo(BaseModel):
             return d
 
         # Newton-Raphson iteration
-        for _ in range(20):
+        for _ in range(4):
             lon, speed = calc_lon_ut(current, swe.SUN)
             err = _angdiff_signed(lon, target)
 
-            if abs(err) < 1e-6:
+            if abs(err) < 1e-7:
                 break
 
-            current -= err / (speed if speed != 0 else 0.9856)
+            if speed < 0.2:
+                raise RuntimeError(f"Unexpected solar speed {speed} deg/day at JD {current}")
+            current -= err / speed
 
         return current
 
@@ -327,34 +377,7 @@ class RawBodyGraph(BaseModel):
         Returns:
             List of RawActivation for all planets
         """
-        definitions = BodyGraphDefinition.load()
-        activations: list[RawActivation] = []
-
-        # Sun
-        sun_lon = Planet.SUN.lon_ut(jd_ut)
-        gate_num, line_num = definitions.gate_and_line_from_longitude(sun_lon)
-        activations.append(RawActivation(planet=Planet.SUN, gate=gate_num, line=line_num))
-
-        # Earth = opposite of Sun (Sun + 180°)
-        earth_lon = (sun_lon + 180.0) % 360.0
-        gate_num, line_num = definitions.gate_and_line_from_longitude(earth_lon)
-        activations.append(RawActivation(planet=Planet.EARTH, gate=gate_num, line=line_num))
-
-        # All other planets (skip SUN, EARTH, and SOUTH_NODE as we handle those specially)
-        for planet in Planet:
-            if planet in (Planet.SUN, Planet.EARTH, Planet.SOUTH_NODE):
-                continue
-            lon = planet.lon_ut(jd_ut)
-            gate_num, line_num = definitions.gate_and_line_from_longitude(lon)
-            activations.append(RawActivation(planet=planet, gate=gate_num, line=line_num))
-
-        # South Node = opposite of North Node
-        north_node_lon = Planet.NORTH_NODE.lon_ut(jd_ut)
-        south_node_lon = (north_node_lon + 180.0) % 360.0
-        gate_num, line_num = definitions.gate_and_line_from_longitude(south_node_lon)
-        activations.append(RawActivation(planet=Planet.SOUTH_NODE, gate=gate_num, line=line_num))
-
-        return activations
+        return _activations_at(jd_ut)
 
     @property
     def all_activated_gates(self) -> set[GateNumber]:
@@ -81,10 +81,12 @@ class CenterRegistry:
 
     _instance: ClassVar["CenterRegistry | None"] = None
     _gate_to_center: dict[GateNumber, CenterName]
+    _center_to_gates: dict[CenterName, tuple[GateNumber, ...]]
 
     def __init__(self):
         """Private constructor. Use CenterRegistry.load() instead."""
         self._gate_to_center = {}
+        self._center_to_gates = {}
 
     @classmethod
     def load(cls) -> "CenterRegistry":
@@ -111,13 +113,16 @@ class CenterRegistry:
                 centers_data = yaml.safe_load(f)
 
             gate_to_center: dict[GateNumber, CenterName] = {}
+            center_to_gates: dict[CenterName, tuple[GateNumber, ...]] = {}
             for center in centers_data:
                 center_name = center["name"]
+                center_to_gates[center_name] = tuple(center["gates"])
                 for gate in center["gates"]:
                     gate_to_center[gate] = center_name
 
             registry = cls()
             registry._gate_to_center = gate_to_center
+            registry._center_to_gates = center_to_gates
             return registry
 
         except Exception as e:
@@ -138,6 +143,21 @@ class CenterRegistry:
         """
         return self._gate_to_center[gate]
 
+    def get_gates(self, center: CenterName) -> tuple[GateNumber, ...]:
+        """
+        Get the gates that belong to a center.
+
+        Args:
+            center: Center name
+
+        Returns:
+            Gate numbers in the order listed in centers.yaml
+
+        Raises:
+            KeyError: If the center is unknown
+        """
+        return self._center_to_gates[center]
+
 
 class ChannelRegistry:
     """
@@ -149,10 +169,14 @@ class ChannelRegistry:
 
     _instance: ClassVar["ChannelRegistry | None"] = None
     _channels: list[ChannelDefinition]
+    _by_gate_pair: dict[frozenset[GateNumber], ChannelDefinition]
+    _by_gate: dict[GateNumber, tuple[ChannelDefinition, ...]]
 
     def __init__(self):
         """Private constructor. Use ChannelRegistry.load() instead."""
         self._channels = []
+        self._by_gate_pair = {}
+        self._by_gate = {}
 
     @classmethod
     def load(cls) -> "ChannelRegistry":
@@ -196,11 +220,21 @@ class ChannelRegistry:
 
             registry = cls()
             registry._channels = channels
+            registry._build_indexes()
             return registry
 
         except Exception as e:
             raise ValueError(f"Failed to load channels.yaml: {e}") from e
 
+    def _build_indexes(self) -> None:
+        """Index channels by gate pair and by gate so lookups don't scan all 36."""
+        by_gate: dict[GateNumber, list[ChannelDefinition]] = {}
+        for channel in self._channels:
+            self._by_gate_pair[frozenset(channel.gates)] = channel
+            by_gate.setdefault(channel.gate_a, []).append(channel)
+            by_gate.setdefault(channel.gate_b, []).append(channel)
+        self._by_gate = {gate: tuple(channels) for gate, channels in by_gate.items()}
+
     @property
     def all_channels(self) -> list[ChannelDefinition]:
         """Get all 36 channel definitions."""
@@ -219,3 +253,28 @@ class ChannelRegistry:
             List of formed channels (may be empty)
         """
         return [ch for ch in self._channels if ch.is_formed_by(activated_gates)]
+
+    def get_channel(self, gate_a: GateNumber, gate_b: GateNumber) -> ChannelDefinition | None:
+        """
+        Get the channel connecting two gates.
+
+        Args:
+            gate_a: Gate at either end of the channel
+            gate_b: Gate at the other end
+
+        Returns:
+            The channel, or None if the gates don't form one
+        """
+        return self._by_gate_pair.get(frozenset((gate_a, gate_b)))
+
+    def get_channels_for_gate(self, gate: GateNumber) -> tuple[ChannelDefinition, ...]:
+        """
+        Get every channel that has the given gate at one end.
+
+        Args:
+            gate: Gate number (1-64)
+
+        Returns:
+            Channels through this gate (empty for gates with no channel)
+        """
+        return self._by_gate.get(gate, ())
@@ -14,8 +14,8 @@ from zoneinfo import ZoneInfo
 import pytz  # type: ignore
 import swisseph as swe  # type: ignore
 from pydantic import BaseModel, RootModel, computed_field
-from timezonefinder import TimezoneFinder
 
+from ..calculate_utils import get_timezone_finder
 from .core import ZodiacSignField
 
 
@@ -51,7 +51,7 @@ class GeographicalCoordinate(BaseModel):
     @property
     def timezone(self) -> str:
         """Determine timezone from coordinates."""
-        tz = TimezoneFinder().timezone_at(lat=self.lat, lng=self.lon)
+        tz = get_timezone_finder().timezone_at(lat=self.lat, lng=self.lon)
         if tz is None:
             raise RuntimeError(
                 f"Could not determine timezone for coordinates: {self.lat}, {self.lon}"
@@ -129,8 +129,7 @@ class Location(BaseModel):
         place = f"{city}, {country}"
         lat, lon = geocode_place(place)
 
-        tf = TimezoneFinder()
-        tz_name = tf.timezone_at(lat=lat, lng=lon)
+        tz_name = get_timezone_finder().timezone_at(lat=lat, lng=lon)
         if tz_name is None:
             raise RuntimeError(f"Could not determine timezone for coordinates: {lat}, {lon}")
 
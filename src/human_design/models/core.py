@@ -123,17 +123,22 @@ class Planet(Enum):
         """Calculate the zodiac longitude for this planet at the given Julian Day UT."""
         if self == Planet.SOUTH_NODE:
             raise ValueError("SOUTH_NODE is computed from NORTH_NODE, not directly calculated")
-        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
-        (xx, _retflag) = swe.calc_ut(jd_ut, self.value, flags)
+        # Longitude only: without FLG_SPEED swisseph skips the velocity terms
+        (xx, _retflag) = swe.calc_ut(jd_ut, self.value, swe.FLG_SWIEPH)
         lon = float(xx[0])
         return lon % 360.0
 
-    def speed_ut(self, jd_ut: float) -> float:
-        """Calculate the zodiac speed for this planet at the given Julian Day UT."""
+    def lon_speed_ut(self, jd_ut: float) -> tuple[float, float]:
+        """Calculate the zodiac longitude and speed (deg/day) at the given Julian Day UT."""
+        if self == Planet.SOUTH_NODE:
+            raise ValueError("SOUTH_NODE is computed from NORTH_NODE, not directly calculated")
         flags = swe.FLG_SWIEPH | swe.FLG_SPEED
         (xx, _retflag) = swe.calc_ut(jd_ut, self.value, flags)
-        speed = float(xx[3])  # deg/day (with FLG_SPEED)
-        return speed
+        return float(xx[0]) % 360.0, float(xx[3])
+
+    def speed_ut(self, jd_ut: float) -> float:
+        """Calculate the zodiac speed for this planet at the given Julian Day UT."""
+        return self.lon_speed_ut(jd_ut)[1]
 
 
 class ZodiacSign(Enum):
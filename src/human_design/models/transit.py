@@ -14,12 +14,11 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, computed_field, model_validator
 from typing_extensions import Self
-from timezonefinder import TimezoneFinder
 
-from ..calculate_utils import geocode_place
-from .bodygraph import BodyGraphDefinition, RawActivation
+from ..calculate_utils import geocode_place, get_timezone_finder
+from .bodygraph import RawActivation, _activations_at
 from .channel import ChannelDefinition, ChannelRegistry
-from .core import CenterName, GateNumber, Planet
+from .core import CenterName, GateNumber
 from .type_authority import Authority, HDType, Profile, TypeAuthorityCalculator
 
 if TYPE_CHECKING:
@@ -81,8 +80,7 @@ class Transit(BaseModel):
     def timezone(self) -> str:
         """Timezone for the location."""
         lat, lon = self.coordinates
-        tf = TimezoneFinder()
-        tz_name = tf.timezone_at(lat=lat, lng=lon)
+        tz_name = get_timezone_finder().timezone_at(lat=lat, lng=lon)
         if tz_name is None:
             raise RuntimeError(f"Could not determine timezone for: {self.location}")
         return tz_name
@@ -104,22 +102,7 @@ class Transit(BaseModel):
         Returns single set of activations (not conscious + unconscious).
         This is what distinguishes Transit from BodyGraph.
         """
-        definitions = BodyGraphDefinition.load()
-        activations: list[RawActivation] = []
-
-        # Calculate all planetary positions
-        for planet in Planet:
-            if planet == Planet.SOUTH_NODE:
-                # South Node is opposite of North Node
-                north_node_lon = Planet.NORTH_NODE.lon_ut(self.jd_ut)
-                lon = (north_node_lon + 180.0) % 360.0
-            else:
-                lon = planet.lon_ut(self.jd_ut)
-
-            gate_num, line_num = definitions.gate_and_line_from_longitude(lon)
-            activations.append(RawActivation(planet=planet, gate=gate_num, line=line_num))
-
-        return activations
+        return _activations_at(self.jd_ut)
 
     @property
     def all_activated_gates(self) -> set[GateNumber]:
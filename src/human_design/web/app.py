@@ -19,12 +19,14 @@ import os
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import boto3
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 
@@ -763,36 +765,72 @@ async def gates_page(request: Request) -> HTMLResponse:
     )
 
 
+# The gate tables are read-only, so each of their API responses is encoded once
+_STATIC_TABLES = {
+    "gates": GATES,
+    "channels": CHANNELS,
+    "circuit_groups": CIRCUIT_GROUPS,
+    "clusters": CONFUSABLE_CLUSTERS,
+}
+
+
+def _encode_json(content: Any) -> bytes:
+    """Encode content the same way FastAPI's JSONResponse would."""
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+@cache
+def _static_table_body(key: str) -> bytes:
+    """Encode {key: table} once and keep the bytes."""
+    return _encode_json({key: _STATIC_TABLES[key]})
+
+
+@cache
+def _gate_detail_body(gate_number: int) -> bytes:
+    """Encode one gate's detail response once and keep the bytes (at most 64 entries)."""
+    return _encode_json({"gate_number": gate_number, **GATES[gate_number]})
+
+
+def _static_table_response(key: str) -> Response:
+    """Serve a pre-encoded static table as JSON."""
+    return Response(content=_static_table_body(key), media_type="application/json")
+
+
 @app.get("/api/gates")
-async def get_gates_list() -> dict[str, Any]:
+async def get_gates_list() -> Response:
     """Return all 64 gates with metadata for flash cards."""
-    return {"gates": GATES}
+    return _static_table_response("gates")
 
 
 @app.get("/api/gates/{gate_number}")
-async def get_gate_detail(gate_number: int) -> dict[str, Any]:
+async def get_gate_detail(gate_number: int) -> Response:
     """Return detailed gate info including memory hooks."""
     if gate_number not in GATES:
         raise HTTPException(status_code=404, detail=f"Gate {gate_number} not found")
-    return {"gate_number": gate_number, **GATES[gate_number]}
+    return Response(content=_gate_detail_body(gate_number), media_type="application/json")
 
 
 @app.get("/api/channels")
-async def get_channels_list() -> dict[str, Any]:
+async def get_channels_list() -> Response:
     """Return all 36 channels with gate pairs and circuit info."""
-    return {"channels": CHANNELS}
+    return _static_table_response("channels")
 
 
 @app.get("/api/circuits")
-async def get_circuits() -> dict[str, Any]:
+async def get_circuits() -> Response:
     """Return circuit group metadata."""
-    return {"circuit_groups": CIRCUIT_GROUPS}
+    return _static_table_response("circuit_groups")
 
 
 @app.get("/api/confusables")
-async def get_confusables() -> dict[str, Any]:
+async def get_confusables() -> Response:
     """Return confusable gate clusters for disambiguation study."""
-    return {"clusters": CONFUSABLE_CLUSTERS}
+    return _static_table_response("clusters")
 
 
 @app.get("/api/learning/progress")
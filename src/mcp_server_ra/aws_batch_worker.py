@@ -12,6 +12,8 @@ from dataclasses import dataclass, asdict, field
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from .workers import find_audio_files
+
 try:
     import boto3
     HAS_BOTO3 = True
@@ -89,13 +91,7 @@ class AWSBatchWorkerPool:
         self.s3 = boto3.client('s3')
 
         # Get all audio files
-        mp3_files = list(self.audio_dir.glob("*.mp3")) + list(
-            self.audio_dir.glob("**/*.mp3")
-        )
-        m4a_files = list(self.audio_dir.glob("*.m4a")) + list(
-            self.audio_dir.glob("**/*.m4a")
-        )
-        self.audio_files = sorted(list(set(mp3_files + m4a_files)))
+        self.audio_files = find_audio_files(self.audio_dir)
         self.total_files = len(self.audio_files)
 
         logger.info(
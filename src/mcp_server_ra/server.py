@@ -17,7 +17,7 @@ from typing import AsyncIterator, Annotated
 from mcp.server.fastmcp import FastMCP, Context
 from pydantic import Field
 
-from .workers import WorkerPool
+from .workers import WorkerPool, find_audio_files
 
 # Configure logging (NOT stdout/print - that breaks STDIO JSON-RPC)
 logging.basicConfig(
@@ -99,9 +99,7 @@ async def list_series(
     for series_dir in sorted(HD_AUDIO_DIR.glob("*/")):
         if series_dir.is_dir():
             # Find audio files in both direct and nested directories
-            mp3_files = list(series_dir.glob("*.mp3")) + list(series_dir.glob("**/*.mp3"))
-            m4a_files = list(series_dir.glob("*.m4a")) + list(series_dir.glob("**/*.m4a"))
-            total_files = len(set(mp3_files + m4a_files))  # Deduplicate
+            total_files = len(find_audio_files(series_dir))
             
             if total_files > 0:
                 series_list.append({
@@ -137,9 +135,7 @@ async def search_series(
     for series_dir in sorted(HD_AUDIO_DIR.glob("*/")):
         if query_lower in series_dir.name.lower():
             # Find audio files in both direct and nested directories
-            mp3_files = list(series_dir.glob("*.mp3")) + list(series_dir.glob("**/*.mp3"))
-            m4a_files = list(series_dir.glob("*.m4a")) + list(series_dir.glob("**/*.m4a"))
-            total_files = len(set(mp3_files + m4a_files))  # Deduplicate
+            total_files = len(find_audio_files(series_dir))
             
             if total_files > 0:
                 matching.append({
@@ -181,9 +177,7 @@ async def start_transcription(
         return json.dumps({"error": f"Series not found: {series_name}"}, indent=2)
     
     # Find audio files in both direct and nested directories
-    mp3_files = list(series_path.glob("*.mp3")) + list(series_path.glob("**/*.mp3"))
-    m4a_files = list(series_path.glob("*.m4a")) + list(series_path.glob("**/*.m4a"))
-    audio_files = sorted(list(set(mp3_files + m4a_files)))  # Deduplicate and sort
+    audio_files = find_audio_files(series_path)
     
     if not audio_files:
         return json.dumps({"error": f"No audio files found in {series_name}"}, indent=2)
@@ -204,7 +198,7 @@ async def start_transcription(
     context = ctx.request_context.lifespan_context
     context.active_jobs[job_id] = {
         "series": series_name,
-        "total_files": len(mp3_files),
+        "total_files": len(audio_files),
         "workers": workers,
         "model": model,
         "status": "running",
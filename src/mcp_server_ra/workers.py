@@ -8,6 +8,7 @@ Currently uses subprocess with faster-whisper (CPU-based).
 
 import json
 import logging
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -17,6 +18,22 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+AUDIO_EXTENSIONS = (".mp3", ".m4a")
+
+
+def find_audio_files(audio_dir: Path) -> list[Path]:
+    """Find audio files in a directory and all nested directories, sorted
+
+    Walks the tree once with os.scandir (via os.walk) rather than globbing
+    it once per pattern.
+    """
+    return sorted(
+        Path(root) / name
+        for root, _dirs, files in os.walk(audio_dir)
+        for name in files
+        if name.endswith(AUDIO_EXTENSIONS)
+    )
+
 
 @dataclass
 class TranscriptionJob:
@@ -63,9 +80,7 @@ class WorkerPool:
         self.job_id = job_id or f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
         # Get all audio files from direct and nested directories
-        mp3_files = list(self.audio_dir.glob("*.mp3")) + list(self.audio_dir.glob("**/*.mp3"))
-        m4a_files = list(self.audio_dir.glob("*.m4a")) + list(self.audio_dir.glob("**/*.m4a"))
-        self.audio_files = sorted(list(set(mp3_files + m4a_files)))  # Deduplicate and sort
+        self.audio_files = find_audio_files(self.audio_dir)
         self.total_files = len(self.audio_files)
         self.container_ids: List[str] = []
 
@@ -95,12 +110,6 @@ class WorkerPool:
         logger.info(f"[{self.job_id}] Calculated ranges: {ranges}")
         return ranges
     
-    def _get_parallel_transcribe_script(self) -> Path:
-        """Locate the parallel_transcribe.py script in workspace root"""
-        script_path = Path(__file__).parent.parent.parent / "parallel_transcribe.py"
-        if not script_path.exists():
-            raise FileNotFoundError(f"parallel_transcribe.py not found at {script_path}")
-    
     def _get_parallel_transcribe_script(self) -> Path:
         """Locate the parallel_transcribe.py script in workspace root"""
         script_path = Path(__file__).parent.parent.parent / "parallel_transcribe.py"
@@ -162,6 +171,7 @@ class WorkerPool:
                 cmd.extend(["-v", f"{self.model_dir}:/root/.cache/huggingface:ro"])
 
             cmd.extend([
+                "-e", f"WORKER_ID={worker_id}",  # Spreads workers across GPUs
                 "--name", container_name,
                 self.DOCKER_IMAGE,
                 "/workspace/parallel_transcribe.py",
@@ -0,0 +1,281 @@
+"""
+Tests for api_client module.
+
+All 64keys.com API calls are mocked to avoid external dependencies.
+"""
+
+import io
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from human_design.api_client import (
+    AUTH_TTL_SECONDS,
+    DEFAULT_CACHE_MAX_AGE_SECONDS,
+    GATE_CACHE_SCHEMA_VERSION,
+    MAX_FETCH_WORKERS,
+    GateAPI,
+    _load_cached_gates,
+    _save_cached_gates,
+    set_cache_max_age,
+)
+
+GATE_HTML = """
+<html><body>
+<div class="nav"><div class="gatetext">Navigation</div></div>
+<div id="aspectscontainer">
+  <div class="gatenumber">Gate 11</div>
+  <div class="gatesubline">Ideas</div>
+  <div class="qinfo">Quarter: Civilization</div>
+  <div class="gatetext">Peace summary</div>
+  <div class="potentialgatetext">Long description</div>
+  <div class="potentialgateheadline">Strive</div>
+  <div class="gatetext">To be at peace</div>
+  <div class="potentialgateheadline">11.1</div>
+  <div class="gatesubline">Timeliness</div>
+  <div class="gatetext">Line one text</div>
+  <div class="potentialgateheadline">11.2</div>
+  <div class="gatesubline">Rigor</div>
+  <div class="gatetext">Line two text</div>
+</div>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def gate_cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the persistent gate cache at a temporary file."""
+    path = tmp_path / "gates.json"
+    monkeypatch.delenv("DATA_BUCKET", raising=False)
+    monkeypatch.setattr("human_design.api_client._gate_cache_path", lambda: path)
+    monkeypatch.setattr("human_design.api_client._cache_max_age", DEFAULT_CACHE_MAX_AGE_SECONDS)
+    return path
+
+
+class TestGateAPISession:
+    """Tests for GateAPI HTTP session setup."""
+
+    def test_pool_covers_concurrent_fetches(self) -> None:
+        """Test the connection pool is large enough for the fetch thread pool."""
+        adapter = GateAPI().session.get_adapter(GateAPI.LIBRARY_API_URL)
+
+        assert adapter._pool_maxsize >= MAX_FETCH_WORKERS  # type: ignore[attr-defined]
+        assert adapter.max_retries.total == 3  # type: ignore[attr-defined]
+
+
+class TestEnsureAuthenticated:
+    """Tests for session validation caching in GateAPI."""
+
+    @patch.object(GateAPI, "_is_session_valid", return_value=True)
+    def test_validated_session_is_trusted_for_ttl(self, mock_valid: MagicMock) -> None:
+        """Test the session is only re-checked once the TTL has passed."""
+        api = GateAPI()
+        with patch("human_design.api_client.time.monotonic", return_value=1000.0):
+            api._ensure_authenticated()
+            api._ensure_authenticated()
+        assert mock_valid.call_count == 1
+
+        with patch(
+            "human_design.api_client.time.monotonic",
+            return_value=1000.0 + AUTH_TTL_SECONDS,
+        ):
+            api._ensure_authenticated()
+        assert mock_valid.call_count == 2
+
+    @patch.object(GateAPI, "authenticate")
+    @patch.object(GateAPI, "_is_session_valid", return_value=False)
+    def test_expired_session_reauthenticates_on_forbidden(
+        self, mock_valid: MagicMock, mock_auth: MagicMock
+    ) -> None:
+        """Test a 403 from the library API triggers one login and retry."""
+        api = GateAPI()
+        api.is_authenticated = True
+        api._auth_checked_at = time.monotonic()
+        api.session = MagicMock()
+        api.session.get.side_effect = [
+            MagicMock(status_code=403),
+            MagicMock(status_code=200, text=GATE_HTML),
+        ]
+
+        gate = api._fetch_gate_summary(11)
+
+        assert gate.number == 11
+        assert api.session.get.call_count == 2
+        mock_auth.assert_called_once()
+
+
+class TestParseGateHtml:
+    """Tests for GateAPI._parse_gate_html."""
+
+    def test_parses_gate_container(self) -> None:
+        """Test gate fields are read from the aspects container only."""
+        gate = GateAPI()._parse_gate_html(GATE_HTML)
+
+        assert gate.number == 11
+        assert gate.name == "Ideas"
+        assert gate.quarter == "Civilization"
+        assert gate.summary == "Peace summary"
+        assert gate.description == "Long description"
+        assert gate.strive == "To be at peace"
+        assert [(line.line_number, line.title) for line in gate.lines] == [
+            (1, "Timeliness"),
+            (2, "Rigor"),
+        ]
+
+    def test_nested_line_markup(self) -> None:
+        """Test line title and text are found inside wrapper divs."""
+        html = GATE_HTML.replace(
+            '<div class="potentialgateheadline">11.2</div>',
+            '<div class="potentialgateheadline">Lines</div>'
+            '<div class="line"><div class="potentialgateheadline">11.2</div><div class="body">',
+        ).replace("Line two text</div>", "Line two text</div></div></div>")
+
+        gate = GateAPI()._parse_gate_html(html)
+
+        assert [(line.line_number, line.text) for line in gate.lines] == [
+            (1, "Line one text"),
+            (2, "Line two text"),
+        ]
+
+    def test_missing_container_raises(self) -> None:
+        """Test a response without the aspects container is rejected."""
+        with pytest.raises(ValueError, match="gate container"):
+            GateAPI()._parse_gate_html("<html><body><p>Login</p></body></html>")
+
+
+class TestGetGateSummaries:
+    """Tests for GateAPI.get_gate_summaries."""
+
+    @patch.object(GateAPI, "flush_gate_cache")
+    @patch.object(GateAPI, "_ensure_authenticated")
+    @patch.object(GateAPI, "_fetch_gate_summary")
+    def test_fetches_unique_gates_in_order(
+        self, mock_fetch: MagicMock, mock_auth: MagicMock, mock_persist: MagicMock
+    ) -> None:
+        """Test duplicate gates are fetched once and results keep request order."""
+        mock_fetch.side_effect = lambda n: f"gate-{n}"
+        api = GateAPI()
+
+        result = api.get_gate_summaries([3, 1, 3, 5])
+
+        assert list(result) == [3, 1, 5]
+        assert result[5] == "gate-5"
+        assert sorted(c.args[0] for c in mock_fetch.call_args_list) == [1, 3, 5]
+        mock_auth.assert_called_once()
+        mock_persist.assert_called_once()
+
+    @patch.object(GateAPI, "_ensure_authenticated")
+    @patch.object(GateAPI, "get_gate_summary")
+    def test_cached_gates_skip_fetch(self, mock_get: MagicMock, mock_auth: MagicMock) -> None:
+        """Test fully cached requests never authenticate or fetch."""
+        api = GateAPI()
+        api._gate_cache = {1: "cached-1", 2: "cached-2"}  # type: ignore
+
+        result = api.get_gate_summaries([2, 1])
+
+        assert result == {2: "cached-2", 1: "cached-1"}
+        mock_get.assert_not_called()
+        mock_auth.assert_not_called()
+
+
+class TestGateCache:
+    """Tests for the persistent gate cache."""
+
+    def test_round_trip(self) -> None:
+        """Test saved gates load back as equal models."""
+        gate = GateAPI()._parse_gate_html(GATE_HTML)
+
+        _save_cached_gates({11: gate})
+
+        assert _load_cached_gates() == {11: gate}
+
+    def test_schema_mismatch_is_ignored(self, gate_cache_path: Path) -> None:
+        """Test a cache written with another schema version is discarded."""
+        gate = GateAPI()._parse_gate_html(GATE_HTML)
+        _save_cached_gates({11: gate})
+        data = json.loads(gate_cache_path.read_text())
+        data["schema_version"] = GATE_CACHE_SCHEMA_VERSION + 1
+        gate_cache_path.write_text(json.dumps(data))
+
+        assert _load_cached_gates() == {}
+
+    def test_expired_cache_is_ignored(self, gate_cache_path: Path) -> None:
+        """Test a cache older than the max age is discarded."""
+        _save_cached_gates({11: GateAPI()._parse_gate_html(GATE_HTML)})
+        old = time.time() - DEFAULT_CACHE_MAX_AGE_SECONDS - 60
+        os.utime(gate_cache_path, (old, old))
+
+        assert _load_cached_gates() == {}
+
+    def test_refresh_bypasses_cache(self) -> None:
+        """Test a max age of zero ignores an otherwise fresh cache."""
+        _save_cached_gates({11: GateAPI()._parse_gate_html(GATE_HTML)})
+
+        set_cache_max_age(0)
+
+        assert _load_cached_gates() == {}
+
+    def test_corrupt_cache_is_ignored(self, gate_cache_path: Path) -> None:
+        """Test an unreadable cache file starts an empty cache."""
+        gate_cache_path.write_text("{not json")
+
+        assert _load_cached_gates() == {}
+
+    @patch.object(GateAPI, "_ensure_authenticated")
+    def test_fetched_gate_is_written_on_flush(self, mock_auth: MagicMock) -> None:
+        """Test a fetched gate is served from disk by a fresh client after a flush."""
+        api = GateAPI()
+        api.session = MagicMock()
+        api.session.get.return_value = MagicMock(status_code=200, text=GATE_HTML)
+
+        gate = api.get_gate_summary(11)
+        assert _load_cached_gates() == {}
+        api.flush_gate_cache()
+
+        fresh = GateAPI()
+        assert fresh._gate_cache == {11: gate}
+        assert fresh.get_gate_summary(11) == gate
+
+
+    @patch("human_design.api_client._load_cached_gates", return_value={})
+    def test_cache_is_loaded_lazily(self, mock_load: MagicMock) -> None:
+        """Test constructing a client leaves the persistent gate cache unread."""
+        api = GateAPI()
+        mock_load.assert_not_called()
+
+        assert api._gate_cache == {}
+        mock_load.assert_called_once()
+
+
+class TestHomePage:
+    """Tests for fetching the 64keys homepage."""
+
+    @patch.object(GateAPI, "_ensure_authenticated")
+    def test_home_page_is_not_cached(self, mock_auth: MagicMock) -> None:
+        """Test every homepage request goes to the network."""
+        api = GateAPI()
+        api.session = MagicMock()
+        api.session.get.return_value = MagicMock(status_code=200, text="<html>home</html>")
+
+        assert api.get_home_page() == "<html>home</html>"
+        assert api.get_home_page() == "<html>home</html>"
+        assert api.session.get.call_count == 2
+
+    @patch.object(GateAPI, "_ensure_authenticated")
+    def test_save_home_page_streams_to_file(self, mock_auth: MagicMock, tmp_path: Path) -> None:
+        """Test the homepage is streamed straight to the file."""
+        response = MagicMock(status_code=200, raw=io.BytesIO(b"<html>home</html>"))
+        response.__enter__.return_value = response
+        api = GateAPI()
+        api.session = MagicMock()
+        api.session.get.return_value = response
+
+        path = tmp_path / "home.html"
+        api.save_home_page(path)
+
+        assert path.read_bytes() == b"<html>home</html>"
+        api.session.get.assert_called_once_with(GateAPI.HOME_URL, stream=True)
@@ -6,6 +6,7 @@ Tests cover:
 - Geocoding with caching
 """
 
+import json
 import os
 import tempfile
 from unittest.mock import Mock, patch
@@ -13,7 +14,13 @@ from unittest.mock import Mock, patch
 import pytest
 import swisseph as swe  # type: ignore
 
-from human_design.calculate_utils import calc_lon_ut, geocode_place
+from human_design.calculate_utils import (
+    _calc_lon_ut_cached,
+    _geocode_cache,
+    calc_lon_ut,
+    flush_geocode_cache,
+    geocode_place,
+)
 
 
 class TestPlanetaryCalculations:
@@ -38,6 +45,15 @@ class TestPlanetaryCalculations:
         # Sun is near Capricorn at J2000 (around 280-281°)
         assert 275.0 < lon < 285.0
 
+    def test_calc_lon_ut_memoizes_nearby_jd(self) -> None:
+        """Test Julian Days within the rounding quantum share one ephemeris call."""
+        _calc_lon_ut_cached.cache_clear()
+        with patch("human_design.calculate_utils.swe.calc_ut", wraps=swe.calc_ut) as mock_calc:
+            first = calc_lon_ut(2451545.0, swe.MOON)
+            second = calc_lon_ut(2451545.0 + 1e-10, swe.MOON)
+        assert first == second
+        assert mock_calc.call_count == 1
+
 
 class TestGeocoding:
     """Tests for geocoding functionality."""
@@ -66,10 +82,87 @@ class TestGeocoding:
                 assert lat2 == lat
                 assert lon2 == lon
 
+        finally:
+            flush_geocode_cache()
+            if os.path.exists(cache_path):
+                os.unlink(cache_path)
+
+    def test_geocode_cache_readable_without_orjson(self) -> None:
+        """Test that a cache written with orjson is read back by the stdlib fallback."""
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            cache_path = f.name
+
+        try:
+            with patch("geopy.geocoders.ArcGIS") as mock_arcgis:
+                mock_loc = Mock()
+                mock_loc.latitude = 45.5152
+                mock_loc.longitude = -122.6784
+                mock_arcgis.return_value.geocode.return_value = mock_loc
+                geocode_place("Portland, USA", cache_path=cache_path)
+                flush_geocode_cache()
+
+                # Drop the in-memory copy so the file is read back from disk
+                _geocode_cache.cache_clear()
+                mock_arcgis.return_value.geocode.reset_mock()
+                with patch("human_design.calculate_utils.HAS_ORJSON", False):
+                    lat, lon = geocode_place("Portland, USA", cache_path=cache_path)
+                mock_arcgis.return_value.geocode.assert_not_called()
+                assert lat == pytest.approx(45.5152)
+                assert lon == pytest.approx(-122.6784)
         finally:
             if os.path.exists(cache_path):
                 os.unlink(cache_path)
 
+    def test_geocode_writes_are_batched(self) -> None:
+        """Test new results are buffered until the flush threshold is reached."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "geocode.json")
+
+            with (
+                patch("geopy.geocoders.ArcGIS") as mock_arcgis,
+                patch("human_design.calculate_utils.GEOCODE_FLUSH_EVERY", 3),
+            ):
+                mock_loc = Mock()
+                mock_loc.latitude = 1.0
+                mock_loc.longitude = 2.0
+                mock_arcgis.return_value.geocode.return_value = mock_loc
+
+                geocode_place("A", cache_path=cache_path)
+                geocode_place("B", cache_path=cache_path)
+                assert not os.path.exists(cache_path)
+
+                geocode_place("C", cache_path=cache_path)
+                with open(cache_path) as f:
+                    assert sorted(json.load(f)) == ["A", "B", "C"]
+
+                geocode_place("D", cache_path=cache_path)
+                flush_geocode_cache()
+                with open(cache_path) as f:
+                    assert "D" in json.load(f)
+
+    def test_geocode_flush_keeps_entries_from_other_processes(self) -> None:
+        """Test a flush merges entries written to the file since it was loaded."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, "geocode.json")
+
+            with patch("geopy.geocoders.ArcGIS") as mock_arcgis:
+                mock_loc = Mock()
+                mock_loc.latitude = 1.0
+                mock_loc.longitude = 2.0
+                mock_arcgis.return_value.geocode.return_value = mock_loc
+
+                geocode_place("A", cache_path=cache_path)
+                # Another worker flushes its own result in the meantime
+                with open(cache_path, "w") as f:
+                    json.dump({"B": {"lat": 3.0, "lon": 4.0, "ts": 0.0}}, f)
+                flush_geocode_cache()
+
+                with open(cache_path) as f:
+                    assert sorted(json.load(f)) == ["A", "B"]
+                mock_arcgis.return_value.geocode.reset_mock()
+                assert geocode_place("B", cache_path=cache_path) == (3.0, 4.0)
+                mock_arcgis.return_value.geocode.assert_not_called()
+
     def test_geocode_failure(self) -> None:
         """Test geocoding failure raises RuntimeError."""
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
@@ -107,6 +107,13 @@ class TestCenterRegistry:
             assert center is not None
             assert isinstance(center, str)
 
+    def test_get_gates_inverts_get_center(self):
+        """Test center → gates lookup agrees with gate → center."""
+        registry = CenterRegistry.load()
+        assert 1 in registry.get_gates("IDENTITY")
+        for gate_num in range(1, 65):
+            assert gate_num in registry.get_gates(registry.get_center(gate_num))
+
 
 class TestChannelRegistry:
     """Tests for ChannelRegistry singleton."""
@@ -156,6 +163,23 @@ class TestChannelRegistry:
             formed = registry.get_formed_channels({gate_num})
             assert len(formed) == 0, f"Gate {gate_num} should not form channel alone"
 
+    def test_get_channel_by_gate_pair(self):
+        """Test channel lookup by gate pair in either order."""
+        registry = ChannelRegistry.load()
+        channel = registry.get_channel(8, 1)
+        assert channel is not None
+        assert set(channel.gates) == {1, 8}
+        assert registry.get_channel(1, 8) is channel
+        assert registry.get_channel(1, 2) is None
+
+    def test_get_channels_for_gate(self):
+        """Test every channel is indexed under both of its gates."""
+        registry = ChannelRegistry.load()
+        for channel in registry.all_channels:
+            assert channel in registry.get_channels_for_gate(channel.gate_a)
+            assert channel in registry.get_channels_for_gate(channel.gate_b)
+        assert len(registry.get_channels_for_gate(10)) == 3
+
 
 class TestRawBodyGraphIntegration:
     """Tests for RawBodyGraph channel integration."""
@@ -72,3 +72,28 @@ class TestCLIInvocation:
         # Should succeed or have proper error handling
         assert result.exit_code in [0, 1]
 
+
+
+class TestCostExplorerCache:
+    """Tests for the on-disk Cost Explorer response cache."""
+
+    def test_repeat_call_is_served_from_disk(self, tmp_path, monkeypatch) -> None:
+        """Test identical requests hit the API once until refreshed."""
+        from human_design.cli import _call_cost_explorer
+
+        monkeypatch.setattr("human_design.cli.Path.home", lambda: tmp_path)
+        ce = MagicMock()
+        ce.get_cost_and_usage.return_value = {
+            "ResultsByTime": [{"Total": {"UnblendedCost": {"Amount": "1.5"}}}],
+            "ResponseMetadata": {"RequestId": "abc"},
+        }
+        request = {"TimePeriod": {"Start": "2024-01-01", "End": "2024-01-31"}}
+
+        first, first_cached = _call_cost_explorer(ce, "get_cost_and_usage", False, **request)
+        second, second_cached = _call_cost_explorer(ce, "get_cost_and_usage", False, **request)
+        _, refreshed_cached = _call_cost_explorer(ce, "get_cost_and_usage", True, **request)
+
+        assert (first_cached, second_cached, refreshed_cached) == (False, True, False)
+        assert second == first
+        assert "ResponseMetadata" not in second
+        assert ce.get_cost_and_usage.call_count == 2
@@ -0,0 +1,65 @@
+"""Tests for the Ra transcription MCP server tools."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_server_ra import server
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run the async tool tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+def series_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a series with direct and nested audio files under a temporary ~/HD/AUDIO."""
+    audio_root = tmp_path / "AUDIO"
+    series = audio_root / "Ra Uru Hu - Test Series"
+    (series / "disc2").mkdir(parents=True)
+    (series / "01.mp3").touch()
+    (series / "disc2" / "02.m4a").touch()
+    (series / "notes.txt").touch()
+    monkeypatch.setattr(server, "HD_AUDIO_DIR", audio_root)
+    monkeypatch.setattr(server, "RA_TRANSCRIPTS_DIR", tmp_path / "ra_transcripts")
+    return series
+
+
+@pytest.mark.anyio
+async def test_start_transcription_launches_workers(
+    series_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a job is recorded with the discovered file count and its workers are started."""
+    pool = MagicMock()
+    pool.run = AsyncMock(return_value={"container_ids": ["c1", "c2"]})
+    pool_cls = MagicMock(return_value=pool)
+    monkeypatch.setattr(server, "WorkerPool", pool_cls)
+    context = server.TranscriptionContext()
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context = context
+
+    result = json.loads(
+        await server.start_transcription(series_dir.name, workers=2, model="tiny", ctx=ctx)
+    )
+
+    assert result["status"] == "running"
+    assert result["total_files"] == 2
+    assert result["container_ids"] == ["c1", "c2"]
+    job = context.active_jobs[result["job_id"]]
+    assert job["total_files"] == 2
+    assert job["container_ids"] == ["c1", "c2"]
+    assert context.worker_pools[result["job_id"]] is pool
+    assert pool_cls.call_args.kwargs["audio_dir"] == series_dir
+    pool.run.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_start_transcription_unknown_series(series_dir: Path) -> None:
+    """Test an unknown series returns an error without starting a job."""
+    result = json.loads(await server.start_transcription("No Such Series", ctx=MagicMock()))
+
+    assert result == {"error": "Series not found: No Such Series"}
@@ -10,6 +10,7 @@ Tests cover:
 - RawBodyGraph calculation of activations
 """
 
+import math
 from datetime import datetime
 
 import pytest
@@ -138,6 +139,17 @@ class TestBodyGraphDefinition:
         assert 1 <= gate_num <= 64
         assert 1 <= line_num <= 6
 
+    def test_gate_and_line_from_longitude_wraps_past_360(self) -> None:
+        """Test the gate spanning 0 degrees is found on both sides of the seam."""
+        bg_def = BodyGraphDefinition.load()
+
+        # Gate 25 runs from Pisces 28°15' to Aries 3°52'30"
+        assert bg_def.gate_and_line_from_longitude(358.5) == (25, 1)
+        assert bg_def.gate_and_line_from_longitude(3.8) == (25, 6)
+        assert bg_def.gate_and_line_from_longitude(3.875) == (17, 1)
+        # One ulp below the end, where the wrapped offset rounds up to the full span
+        assert bg_def.gate_and_line_from_longitude(math.nextafter(3.875, 0)) == (25, 6)
+
     def test_longitude_maps_to_valid_gate_and_line(self) -> None:
         """Test that any longitude maps to a valid gate and line."""
         bg_def = BodyGraphDefinition.load()
@@ -50,6 +50,14 @@ class TestPlanet:
         # Moon's speed varies but is typically 12-15 degrees per day
         assert 10.0 < speed < 16.0
 
+    def test_lon_speed_matches_separate_calls(self) -> None:
+        """Test lon_speed_ut agrees with the longitude-only and speed calls."""
+        jd = 2451545.0
+        lon, speed = Planet.MARS.lon_speed_ut(jd)
+
+        assert lon == pytest.approx(Planet.MARS.lon_ut(jd), abs=1e-9)
+        assert speed == Planet.MARS.speed_ut(jd)
+
     def test_longitude_always_in_range(self) -> None:
         """Test that all planets return longitude in [0, 360) range."""
         jd = 2451545.0
@@ -63,6 +63,15 @@ class TestTransitCreation:
         assert not hasattr(transit, "conscious_activations")
         assert not hasattr(transit, "unconscious_activations")
 
+    def test_transit_earth_opposes_sun(self):
+        """Test Earth and South Node sit opposite the Sun and North Node."""
+        transit = Transit.at(datetime(2024, 1, 1, 0, 0), location="New York, NY")
+        gates = {act.planet.name: act.gate for act in transit.activations}
+
+        # Sun at ~10° Capricorn (gate 38), so Earth is ~10° Cancer (gate 39)
+        assert (gates["SUN"], gates["EARTH"]) == (38, 39)
+        assert gates["SOUTH_NODE"] != gates["TRUE_NODE"]
+
     def test_transit_location_parsing(self):
         """Test location string parsing."""
         transit = Transit.at(datetime.now(), location="Seattle, WA")